@@ -17,6 +17,7 @@ class Settings(BaseSettings):
 
     # ── Gemini (Google AI) — optional, not currently used ───────────────
     GEMINI_API_KEY: Optional[str] = None
+    GEMINI_WARMUP_ENABLED: bool = True  # 1-token warm-up call on import
 
     # ── LinkedIn (optional until configured) ──────────────────────────────
     LINKEDIN_ACCESS_TOKEN: Optional[str] = None
@@ -33,6 +34,8 @@ class Settings(BaseSettings):
     YOUTUBE_CLIENT_SECRET: Optional[str] = None
     YOUTUBE_REFRESH_TOKEN: Optional[str] = None
     YOUTUBE_TRANSFORM_VIDEO: bool = True  # Transform video to avoid Content ID
+    YOUTUBE_TRANSFORM_CRF: int = 23  # x264 quality for the transform (lower = better)
+    FFMPEG_MAX_CONCURRENCY: int = 0  # 0 = auto: max(1, cpu_count // 4)
 
     # ── Supabase Storage (for royalty-free music) ─────────────────────────
     SUPABASE_URL: Optional[str] = None       # e.g. https://xxxx.supabase.co
@@ -60,6 +63,7 @@ class Settings(BaseSettings):
     # ── Retry ─────────────────────────────────────────────────────────────
     MAX_RETRIES: int = 3
     RETRY_BACKOFF_SECONDS: int = 2
+    HTTP_POOL_MAXSIZE: int = 16  # keep-alive connections per host, per service
 
     # ── Telegram Channel posting ────────────────────────────────────────────
     TELEGRAM_CHANNEL_ID: Optional[str] = None  # @channel or numeric chat ID
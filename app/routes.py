@@ -32,6 +32,7 @@ from datetime import datetime, timezone
 from typing import List, Optional
 
 from fastapi import APIRouter, Body, Depends, File, Form, Header, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from dateutil import parser as dateutil_parser
 from sqlalchemy.orm import Session
@@ -75,6 +76,16 @@ ALLOWED_AUDIO_EXTENSIONS = {".mp3", ".wav", ".ogg", ".m4a", ".flac", ".aac"}
 
 # ── Helper ────────────────────────────────────────────────────────────────────
 
+# Blocking work (HTTP calls, ffprobe, hashing, large file copies) inside the
+# async handlers below is pushed to the threadpool via ``run_in_threadpool``
+# so a slow upload or probe never stalls the event loop for other requests.
+
+def _save_upload(upload: UploadFile, dest_path: str) -> None:
+    """Copy an uploaded file to *dest_path* (blocking — run in threadpool)."""
+    with open(dest_path, "wb") as fh:
+        shutil.copyfileobj(upload.file, fh)
+
+
 def _tool_to_dict(t: AITool) -> dict:
     """Serialise an AITool row to a JSON-safe dict."""
     return {
@@ -123,7 +134,8 @@ async def upload_music_file(
         raise HTTPException(status_code=400, detail="Uploaded file is empty.")
 
     try:
-        result = upload_music_to_supabase(
+        result = await run_in_threadpool(
+            upload_music_to_supabase,
             file_name=file.filename,
             file_bytes=payload,
             content_type=file.content_type or "application/octet-stream",
@@ -150,7 +162,9 @@ async def list_music_files(
 ):
     """List all music files from the Supabase music bucket."""
     try:
-        items = list_music_in_supabase(folder=folder, limit=max(1, min(limit, 1000)))
+        items = await run_in_threadpool(
+            list_music_in_supabase, folder=folder, limit=max(1, min(limit, 1000))
+        )
         return {
             "ok": True,
             "bucket": settings.SUPABASE_MUSIC_BUCKET,
@@ -168,7 +182,7 @@ async def delete_music_file(
 ):
     """Delete one music file from the Supabase music bucket."""
     try:
-        result = delete_music_from_supabase(object_path=object_path)
+        result = await run_in_threadpool(delete_music_from_supabase, object_path=object_path)
         logger.info("Music deleted from Supabase: %s", result["path"])
         return {"ok": True, **result}
     except SupabaseMusicUploadError as exc:
@@ -209,8 +223,7 @@ async def create_tool(
         # Prefix with UUID to prevent filename collisions across uploads
         unique_name = f"{uuid.uuid4().hex[:8]}_{safe_name}"
         dest_path = os.path.join(UPLOAD_DIR, unique_name)
-        with open(dest_path, "wb") as fh:
-            shutil.copyfileobj(video_file.file, fh)
+        await run_in_threadpool(_save_upload, video_file, dest_path)
         video_url = dest_path
         logger.info("Video uploaded: %s", dest_path)
 
@@ -244,7 +257,8 @@ async def create_tool(
         for t in existing
     ]
 
-    validation = validate_video(
+    validation = await run_in_threadpool(
+        validate_video,
         file_path=video_url if video_url and os.path.isfile(video_url) else None,
         video_url=video_url,
         tool_name=tool_name,
@@ -521,7 +535,8 @@ async def token_health(_auth: bool = Depends(verify_auth)):
     # Meta (Instagram + Facebook)
     if settings.META_ACCESS_TOKEN:
         try:
-            r = requests.get(
+            r = await run_in_threadpool(
+                requests.get,
                 "https://graph.facebook.com/v19.0/debug_token",
                 params={
                     "input_token": settings.META_ACCESS_TOKEN,
@@ -713,8 +728,7 @@ async def validate_tool(
     temp_path = None
     if video_file and video_file.filename:
         temp_path = os.path.join(UPLOAD_DIR, f"_validate_{uuid.uuid4().hex[:8]}_{video_file.filename}")
-        with open(temp_path, "wb") as fh:
-            shutil.copyfileobj(video_file.file, fh)
+        await run_in_threadpool(_save_upload, video_file, temp_path)
 
     try:
         existing = db.query(AITool).all()
@@ -734,7 +748,8 @@ async def validate_tool(
         file_to_probe = temp_path or (video_url if video_url and os.path.isfile(video_url) else None)
         url_to_check = video_url if video_url else None
 
-        validation = validate_video(
+        validation = await run_in_threadpool(
+            validate_video,
             file_path=file_to_probe,
             video_url=url_to_check,
             tool_name=tool_name,
@@ -12,6 +12,7 @@ import os
 import time
 import functools
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Callable
@@ -98,6 +99,39 @@ _post_telegram_channel = retry(settings.MAX_RETRIES, settings.RETRY_BACKOFF_SECO
 _post_reddit = retry(settings.MAX_RETRIES, settings.RETRY_BACKOFF_SECONDS)(post_to_reddit)
 
 
+# (status-column prefix, display label, retried post function) — in the
+# order per-platform errors are reported
+_PLATFORMS = (
+    ("linkedin", "LinkedIn", _post_linkedin),
+    ("instagram", "Instagram", _post_instagram),
+    ("facebook", "Facebook", _post_facebook),
+    ("youtube", "YouTube", _post_youtube),
+    ("x", "X", _post_x),
+    ("telegram_channel", "Telegram", _post_telegram_channel),
+    ("reddit", "Reddit", _post_reddit),
+)
+
+
+def _transform_and_post_youtube(
+    title: str, description: str, video_path: str, video_url: str,
+) -> bool:
+    """Transform the video for YouTube (if enabled), upload it, then clean up.
+
+    The transform is cached under the tool's *video_url*, so a failed upload
+    keeps the file for the next attempt (a fresh download of the same URL
+    maps to the same output).  Without a stable source id the output could
+    never be hit again, so it is removed either way.
+    """
+    yt_video = video_path
+    if settings.YOUTUBE_TRANSFORM_VIDEO:
+        # Strip audio, add overlay, speed shift
+        yt_video = transform_for_youtube(video_path, title, source_id=video_url or None)
+    ok = _post_youtube(title, description, yt_video)
+    if yt_video != video_path and (ok or not video_url):
+        cleanup_transformed(yt_video)
+    return ok
+
+
 # ── Cleanup helpers ───────────────────────────────────────────────────────────
 
 # How long to keep uploaded videos (allows retries before cleanup)
@@ -187,123 +221,103 @@ def _process_tool(tool: AITool, db) -> None:  # noqa: ANN001
         success_count = 0
         error_parts = []   # collect per-platform errors for the error_log
 
-        # LinkedIn
-        if settings.LINKEDIN_ACCESS_TOKEN and (settings.LINKEDIN_ORG_ID or settings.LINKEDIN_PERSON_URN):
-            if tool.linkedin_status == "SUCCESS":
-                logger.info("LinkedIn: already SUCCESS — skipping to avoid duplicate.")
-            else:
-                linkedin_ok = _post_linkedin(captions["linkedin"], video_path)
-                tool.linkedin_status = "SUCCESS" if linkedin_ok else "FAILED"
-                if linkedin_ok:
-                    success_count += 1
+        # Every platform is an independent, network-bound upload timeline —
+        # run them concurrently so the wall-clock cost is the slowest
+        # platform instead of the sum of all of them.  Statuses are written
+        # back on this thread (the DB session is not thread-safe).
+        futures = {}
+        with ThreadPoolExecutor(max_workers=len(_PLATFORMS), thread_name_prefix="post") as pool:
+            # LinkedIn
+            if settings.LINKEDIN_ACCESS_TOKEN and (settings.LINKEDIN_ORG_ID or settings.LINKEDIN_PERSON_URN):
+                if tool.linkedin_status == "SUCCESS":
+                    logger.info("LinkedIn: already SUCCESS — skipping to avoid duplicate.")
                 else:
-                    error_parts.append(f"LinkedIn: {_post_linkedin.last_error or 'posting failed'}")
-        else:
-            tool.linkedin_status = "SKIPPED"
-            logger.info("LinkedIn: skipped (credentials not configured).")
-
-        # Instagram  (uses the *public* video URL, not local path)
-        if settings.META_ACCESS_TOKEN and settings.INSTAGRAM_BUSINESS_ID:
-            if tool.instagram_status == "SUCCESS":
-                logger.info("Instagram: already SUCCESS — skipping to avoid duplicate.")
+                    futures["linkedin"] = pool.submit(_post_linkedin, captions["linkedin"], video_path)
             else:
-                instagram_ok = _post_instagram(captions["instagram"], tool.video_url)
-                tool.instagram_status = "SUCCESS" if instagram_ok else "FAILED"
-                if instagram_ok:
-                    success_count += 1
-                else:
-                    error_parts.append(f"Instagram: {_post_instagram.last_error or 'posting failed'}")
-        else:
-            tool.instagram_status = "SKIPPED"
-            logger.info("Instagram: skipped (credentials not configured).")
+                tool.linkedin_status = "SKIPPED"
+                logger.info("LinkedIn: skipped (credentials not configured).")
 
-        # Facebook Reels  (uses local video path)
-        if settings.META_ACCESS_TOKEN and settings.FACEBOOK_PAGE_ID:
-            if tool.facebook_status == "SUCCESS":
-                logger.info("Facebook: already SUCCESS — skipping to avoid duplicate.")
-            else:
-                facebook_ok = _post_facebook(captions["facebook"], video_path)
-                tool.facebook_status = "SUCCESS" if facebook_ok else "FAILED"
-                if facebook_ok:
-                    success_count += 1
+            # Instagram  (uses the *public* video URL, not local path)
+            if settings.META_ACCESS_TOKEN and settings.INSTAGRAM_BUSINESS_ID:
+                if tool.instagram_status == "SUCCESS":
+                    logger.info("Instagram: already SUCCESS — skipping to avoid duplicate.")
                 else:
-                    error_parts.append(f"Facebook: {_post_facebook.last_error or 'posting failed'}")
-        else:
-            tool.facebook_status = "SKIPPED"
-            logger.info("Facebook: skipped (credentials not configured).")
-
-        # YouTube Shorts  (transform video to avoid Content ID strikes)
-        yt_transformed_path = None
-        if settings.YOUTUBE_CLIENT_ID and settings.YOUTUBE_CLIENT_SECRET and settings.YOUTUBE_REFRESH_TOKEN:
-            if tool.youtube_status == "SUCCESS":
-                logger.info("YouTube: already SUCCESS — skipping to avoid duplicate.")
+                    futures["instagram"] = pool.submit(_post_instagram, captions["instagram"], tool.video_url)
             else:
-                # Transform video: strip audio, add overlay, speed shift
-                if settings.YOUTUBE_TRANSFORM_VIDEO:
-                    yt_video = transform_for_youtube(video_path, tool.tool_name)
-                    if yt_video != video_path:
-                        yt_transformed_path = yt_video
-                else:
-                    yt_video = video_path
+                tool.instagram_status = "SKIPPED"
+                logger.info("Instagram: skipped (credentials not configured).")
 
-                youtube_ok = _post_youtube(tool.tool_name, captions["youtube"], yt_video)
-                tool.youtube_status = "SUCCESS" if youtube_ok else "FAILED"
-                if youtube_ok:
-                    success_count += 1
+            # Facebook Reels  (uses local video path)
+            if settings.META_ACCESS_TOKEN and settings.FACEBOOK_PAGE_ID:
+                if tool.facebook_status == "SUCCESS":
+                    logger.info("Facebook: already SUCCESS — skipping to avoid duplicate.")
                 else:
-                    error_parts.append(f"YouTube: {_post_youtube.last_error or 'posting failed'}")
-
-                # Cleanup transformed file immediately after upload
-                if yt_transformed_path:
-                    cleanup_transformed(yt_transformed_path)
-        else:
-            tool.youtube_status = "SKIPPED"
-            logger.info("YouTube: skipped (credentials not configured).")
-
-        # X (Twitter)
-        if settings.X_API_KEY and settings.X_API_SECRET and settings.X_ACCESS_TOKEN and settings.X_ACCESS_SECRET:
-            if tool.x_status == "SUCCESS":
-                logger.info("X: already SUCCESS — skipping to avoid duplicate.")
+                    futures["facebook"] = pool.submit(_post_facebook, captions["facebook"], video_path)
             else:
-                x_ok = _post_x(captions["x"], video_path)
-                tool.x_status = "SUCCESS" if x_ok else "FAILED"
-                if x_ok:
-                    success_count += 1
-                else:
-                    error_parts.append(f"X: {_post_x.last_error or 'posting failed'}")
-        else:
-            tool.x_status = "SKIPPED"
-            logger.info("X/Twitter: skipped (credentials not configured).")
+                tool.facebook_status = "SKIPPED"
+                logger.info("Facebook: skipped (credentials not configured).")
 
-        # Telegram Channel
-        if settings.TELEGRAM_BOT_TOKEN and getattr(settings, 'TELEGRAM_CHANNEL_ID', None):
-            if tool.telegram_channel_status == "SUCCESS":
-                logger.info("Telegram Channel: already SUCCESS — skipping.")
+            # YouTube Shorts  (transform video to avoid Content ID strikes)
+            if settings.YOUTUBE_CLIENT_ID and settings.YOUTUBE_CLIENT_SECRET and settings.YOUTUBE_REFRESH_TOKEN:
+                if tool.youtube_status == "SUCCESS":
+                    logger.info("YouTube: already SUCCESS — skipping to avoid duplicate.")
+                else:
+                    futures["youtube"] = pool.submit(
+                        _transform_and_post_youtube,
+                        tool.tool_name, captions["youtube"], video_path, tool.video_url,
+                    )
             else:
-                tg_ok = _post_telegram_channel(captions["telegram_channel"], video_path)
-                tool.telegram_channel_status = "SUCCESS" if tg_ok else "FAILED"
-                if tg_ok:
-                    success_count += 1
+                tool.youtube_status = "SKIPPED"
+                logger.info("YouTube: skipped (credentials not configured).")
+
+            # X (Twitter)
+            if settings.X_API_KEY and settings.X_API_SECRET and settings.X_ACCESS_TOKEN and settings.X_ACCESS_SECRET:
+                if tool.x_status == "SUCCESS":
+                    logger.info("X: already SUCCESS — skipping to avoid duplicate.")
                 else:
-                    error_parts.append(f"Telegram: {_post_telegram_channel.last_error or 'posting failed'}")
-        else:
-            tool.telegram_channel_status = "SKIPPED"
-            logger.info("Telegram Channel: skipped (not configured).")
+                    futures["x"] = pool.submit(_post_x, captions["x"], video_path)
+            else:
+                tool.x_status = "SKIPPED"
+                logger.info("X/Twitter: skipped (credentials not configured).")
 
-        # Reddit
-        if getattr(settings, 'REDDIT_CLIENT_ID', None) and getattr(settings, 'REDDIT_SUBREDDIT', None):
-            if tool.reddit_status == "SUCCESS":
-                logger.info("Reddit: already SUCCESS — skipping.")
+            # Telegram Channel
+            if settings.TELEGRAM_BOT_TOKEN and getattr(settings, 'TELEGRAM_CHANNEL_ID', None):
+                if tool.telegram_channel_status == "SUCCESS":
+                    logger.info("Telegram Channel: already SUCCESS — skipping.")
+                else:
+                    futures["telegram_channel"] = pool.submit(
+                        _post_telegram_channel, captions["telegram_channel"], video_path,
+                    )
             else:
-                reddit_ok = _post_reddit(captions["reddit"], video_path, tool.tool_name)
-                tool.reddit_status = "SUCCESS" if reddit_ok else "FAILED"
-                if reddit_ok:
-                    success_count += 1
+                tool.telegram_channel_status = "SKIPPED"
+                logger.info("Telegram Channel: skipped (not configured).")
+
+            # Reddit
+            if getattr(settings, 'REDDIT_CLIENT_ID', None) and getattr(settings, 'REDDIT_SUBREDDIT', None):
+                if tool.reddit_status == "SUCCESS":
+                    logger.info("Reddit: already SUCCESS — skipping.")
                 else:
-                    error_parts.append(f"Reddit: {_post_reddit.last_error or 'posting failed'}")
-        else:
-            tool.reddit_status = "SKIPPED"
-            logger.info("Reddit: skipped (not configured).")
+                    futures["reddit"] = pool.submit(_post_reddit, captions["reddit"], video_path, tool.tool_name)
+            else:
+                tool.reddit_status = "SKIPPED"
+                logger.info("Reddit: skipped (not configured).")
+
+        for key, label, post_fn in _PLATFORMS:
+            if key not in futures:
+                continue
+            # The other platforms already ran concurrently: an exception from
+            # one future must not stop the rest of the statuses being saved
+            try:
+                ok = futures[key].result()
+                error = post_fn.last_error or "posting failed"
+            except Exception as exc:
+                logger.error("%s: posting raised: %s", label, exc)
+                ok, error = False, str(exc)
+            setattr(tool, f"{key}_status", "SUCCESS" if ok else "FAILED")
+            if ok:
+                success_count += 1
+            else:
+                error_parts.append(f"{label}: {error}")
 
         # Save error log if any failures
         tool.error_log = " | ".join(error_parts) if error_parts else None
@@ -527,17 +541,11 @@ def start_scheduler() -> None:
     )
     logger.info("Token expiry alert job registered (every 6h, warn at %dd).", _EXPIRY_WARN_DAYS)
 
-    # Telegram bot polling: every 30 seconds
+    # Telegram bot: long-polling in its own thread (replies within ~1s)
     if settings.TELEGRAM_BOT_TOKEN and settings.TELEGRAM_CHAT_ID:
-        from app.services.telegram_bot import poll_telegram_updates
-        scheduler.add_job(
-            poll_telegram_updates,
-            "interval",
-            seconds=30,
-            id="telegram_bot_poll",
-            replace_existing=True,
-        )
-        logger.info("Telegram bot polling registered (every 30s).")
+        from app.services.telegram_bot import start_polling
+        start_polling()
+        logger.info("Telegram bot long-polling started.")
 
     scheduler.start()
     logger.info(
@@ -561,6 +569,9 @@ def start_scheduler() -> None:
 
 def stop_scheduler() -> None:
     """Gracefully shut down the scheduler."""
+    if settings.TELEGRAM_BOT_TOKEN and settings.TELEGRAM_CHAT_ID:
+        from app.services.telegram_bot import stop_polling
+        stop_polling()
     if scheduler.running:
         scheduler.shutdown(wait=False)
         logger.info("Scheduler stopped.")
@@ -8,7 +8,8 @@ Gemini is unavailable or if the API key is not configured.
 Returns a dict with keys: x, linkedin, instagram, facebook, youtube, telegram_channel, reddit.
 """
 
-from typing import Dict, Optional
+import threading
+from typing import Dict, List, Optional
 
 import google.generativeai as genai
 
@@ -18,16 +19,35 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 
 # ── Gemini setup ──────────────────────────────────────────────────────────────
+_GEMINI_MODEL_NAME = "gemini-1.5-flash"
+_GEMINI_MODEL: Optional["genai.GenerativeModel"] = None
 _gemini_ready = False
 if settings.GEMINI_API_KEY:
     try:
         genai.configure(api_key=settings.GEMINI_API_KEY)
+        _GEMINI_MODEL = genai.GenerativeModel(_GEMINI_MODEL_NAME)
         _gemini_ready = True
         logger.info("Gemini AI configured for caption generation.")
     except Exception as exc:
         logger.warning("Gemini setup failed, using fallback captions: %s", exc)
 
 
+def _warmup_gemini() -> None:
+    """Issue a throwaway 1-token request so DNS/TLS/channel setup is paid
+    up-front instead of on the first real caption request."""
+    try:
+        _GEMINI_MODEL.generate_content(  # type: ignore[union-attr]
+            "ping", generation_config={"max_output_tokens": 1}
+        )
+        logger.debug("Gemini warm-up complete.")
+    except Exception as exc:
+        logger.debug("Gemini warm-up failed (ignored): %s", exc)
+
+
+if _gemini_ready and settings.GEMINI_WARMUP_ENABLED:
+    threading.Thread(target=_warmup_gemini, name="gemini-warmup", daemon=True).start()
+
+
 # ── Gemini-powered captions ──────────────────────────────────────────────────
 
 _PROMPT_TEMPLATE = """\
@@ -127,7 +147,7 @@ def _generate_with_gemini(
     handle: str,
 ) -> Optional[Dict[str, str]]:
     """Call Gemini to generate platform-specific captions."""
-    if not _gemini_ready:
+    if not _gemini_ready or _GEMINI_MODEL is None:
         return None
 
     prompt = _PROMPT_TEMPLATE.format(
@@ -138,8 +158,7 @@ def _generate_with_gemini(
     )
 
     try:
-        model = genai.GenerativeModel("gemini-1.5-flash")
-        response = model.generate_content(prompt)
+        response = _GEMINI_MODEL.generate_content(prompt)
         text = response.text.strip()
 
         # Strip markdown code fences if present
@@ -170,29 +189,51 @@ def _generate_with_gemini(
 
 # ── Fallback template captions ───────────────────────────────────────────────
 
+def _truncate_join(parts: List[str], sep: str, limit: int) -> str:
+    """Join *parts* with *sep*, stopping once *limit* characters are reached.
+
+    Equivalent to ``sep.join(parts)[:limit]`` but never builds the oversized
+    string when a long description would be cut off anyway.
+    """
+    pieces: List[str] = []
+    remaining: int = limit
+    for idx, part in enumerate(parts):
+        for chunk in ((sep, part) if idx else (part,)):
+            if len(chunk) >= remaining:
+                pieces.append(chunk[:remaining])
+                return "".join(pieces)
+            pieces.append(chunk)
+            remaining -= len(chunk)
+    return "".join(pieces)
+
+
 def _fallback_captions(
     tool_name: str,
     description: Optional[str],
     website: Optional[str],
     handle: Optional[str],
 ) -> Dict[str, str]:
-    """Build engagement-optimized template captions when Gemini is unavailable."""
-    desc = description or "a game-changing AI tool you need to try"
-    site = website or ""
-    credit = f" by {handle}" if handle else ""
-    headline = f"{tool_name}{credit}"
+    """Build engagement-optimized template captions when Gemini is unavailable.
+
+    Parameters and locals are fully annotated so the function stays
+    compatible with ahead-of-time compilers such as mypyc.
+    """
+    desc: str = description or "a game-changing AI tool you need to try"
+    site: str = website or ""
+    credit: str = f" by {handle}" if handle else ""
+    headline: str = f"{tool_name}{credit}"
 
     # X / Twitter — punchy hook + CTA
-    x_lines = [f"Stop scrolling. This AI tool is insane 🤯"]
+    x_lines: List[str] = [f"Stop scrolling. This AI tool is insane 🤯"]
     x_lines.append(f"\n{headline} — {desc}")
     if site:
         x_lines.append(f"\n🔗 {site}")
     x_lines.append("\nBookmark this 🔖")
     x_lines.append("\n#AI #AITools #Tech")
-    x_caption = "".join(x_lines)[:280]
+    x_caption: str = _truncate_join(x_lines, "", 280)
 
     # LinkedIn — thought-leadership hook + CTA
-    linkedin_parts = [
+    linkedin_parts: List[str] = [
         f"Most people don't know about {tool_name} yet.\n\nBut it's about to change everything.",
         f"{desc}" if desc else f"This is one of the most powerful AI tools I've seen this year.",
     ]
@@ -205,10 +246,10 @@ def _fallback_captions(
         "#AI #ArtificialIntelligence #Innovation #Tech #Productivity "
         "#AITools #FutureTech #Automation #MachineLearning #Startup"
     )
-    linkedin_caption = "\n\n".join(linkedin_parts)
+    linkedin_caption: str = "\n\n".join(linkedin_parts)
 
     # Instagram — Reels-optimized with max hashtags
-    instagram_parts = [
+    instagram_parts: List[str] = [
         f"🤯 This AI tool just changed the game → {headline}",
         f"{desc}" if desc else "You NEED to try this.",
         "💾 Save this for later\n📤 Share with a friend who needs this",
@@ -223,10 +264,10 @@ def _fallback_captions(
             "#ReelsViral #InstaReels #TrendingReels"
         ),
     ]
-    instagram_caption = "\n\n".join(instagram_parts)
+    instagram_caption: str = "\n\n".join(instagram_parts)
 
     # Facebook — Reels-optimized, conversational
-    facebook_parts = [
+    facebook_parts: List[str] = [
         f"🚀 Have you tried {headline} yet?",
         f"{desc}" if desc else "This AI tool is a must-try.",
     ]
@@ -237,10 +278,10 @@ def _fallback_captions(
     facebook_parts.append(
         "#AI #AITools #Tech #Innovation #FutureTech #Automation #Reels #Viral"
     )
-    facebook_caption = "\n\n".join(facebook_parts)
+    facebook_caption: str = "\n\n".join(facebook_parts)
 
     # YouTube — Shorts-optimized with #Shorts first
-    youtube_parts = [
+    youtube_parts: List[str] = [
         f"{headline} — AI Tool You NEED to Try",
         f"{desc}" if desc else "One of the best AI tools right now.",
     ]
@@ -251,10 +292,10 @@ def _fallback_captions(
         "#Shorts #AI #AITools #YouTubeShorts #Tech #Innovation "
         "#ArtificialIntelligence #Automation #FutureTech #Trending"
     )
-    youtube_caption = "\n\n".join(youtube_parts)
+    youtube_caption: str = "\n\n".join(youtube_parts)
 
     # Telegram Channel — bold hook + short info
-    tg_parts = [
+    tg_parts: List[str] = [
         f"🤖 <b>{headline}</b>",
         f"{desc}" if desc else "A powerful new AI tool worth checking out.",
     ]
@@ -262,17 +303,17 @@ def _fallback_captions(
         tg_parts.append(f"🔗 {site}")
     tg_parts.append("📢 Join our channel for daily AI discoveries!")
     tg_parts.append("#AI #AITools #Tech")
-    telegram_channel_caption = "\n\n".join(tg_parts)[:1024]
+    telegram_channel_caption: str = _truncate_join(tg_parts, "\n\n", 1024)
 
     # Reddit — genuine community post style
-    reddit_parts = [
+    reddit_parts: List[str] = [
         f"I came across {tool_name} and thought it was worth sharing.",
         f"{desc}" if desc else f"It's an AI tool that looks pretty useful.",
     ]
     if site:
         reddit_parts.append(f"You can check it out here: {site}")
     reddit_parts.append("Has anyone else tried this? Would love to hear your thoughts.")
-    reddit_caption = "\n\n".join(reddit_parts)
+    reddit_caption: str = "\n\n".join(reddit_parts)
 
     return {
         "x": x_caption,
@@ -16,63 +16,83 @@ Ref: https://developers.facebook.com/docs/video-api/guides/reels-publishing
 """
 
 import os
+import threading
 import time
-from datetime import datetime, timezone
 
 import requests
 
 from app.config import settings
+from app.utils.http import build_session, response_json
 from app.utils.logger import get_logger
+from app.utils.streaming import ChunkedFileReader
+from app.utils.upload_cache import file_key, forget_upload, get_upload, remember_upload
 
 logger = get_logger(__name__)
 
+# Keep-alive session shared by every call in this module
+_SESSION = build_session()
+
 GRAPH_URL = "https://graph.facebook.com/v19.0"
 
 # Cache the page token with a TTL so it auto-refreshes if the user token changes
 _page_token_cache: str | None = None
-_page_token_cached_at: datetime | None = None
+_page_token_cached_mono: float | None = None  # time.monotonic() at fetch
 _PAGE_TOKEN_TTL_SECONDS = 3600  # Re-fetch every hour
+# Past this age the cached token is still served, but a background refresh
+# is started so no upload begins with a token about to hit its hard TTL.
+_PAGE_TOKEN_SOFT_TTL = int(_PAGE_TOKEN_TTL_SECONDS * 0.8)
+_page_token_lock = threading.Lock()  # single-flight for /me/accounts
+
+# Invariant fields of the "finish" call; per-post fields are merged in
+_REEL_FINISH_PARAMS = {"upload_phase": "finish", "video_state": "PUBLISHED"}
 
 
 def clear_page_token_cache() -> None:
     """Invalidate the cached page token (call when user token is refreshed)."""
-    global _page_token_cache, _page_token_cached_at
+    global _page_token_cache, _page_token_cached_mono
     _page_token_cache = None
-    _page_token_cached_at = None
+    _page_token_cached_mono = None
     logger.info("Facebook: page token cache cleared.")
 
 
-def _get_page_access_token() -> str:
-    """Exchange the user access token for a Page Access Token.
+def _page_token_age() -> float | None:
+    """Seconds since the cached page token was fetched, or None if uncached."""
+    if _page_token_cache and _page_token_cached_mono is not None:
+        return time.monotonic() - _page_token_cached_mono
+    return None
 
-    The Graph API requires a Page token (not a user token) to publish
-    content on behalf of a Page. Caches with TTL to avoid excessive API calls.
-    """
-    global _page_token_cache, _page_token_cached_at
 
-    # Return cached token if still fresh
-    if _page_token_cache and _page_token_cached_at:
-        elapsed = (datetime.now(timezone.utc) - _page_token_cached_at).total_seconds()
-        if elapsed < _PAGE_TOKEN_TTL_SECONDS:
-            return _page_token_cache
+def _refresh_page_token() -> str:
+    """Fetch a fresh Page Access Token from ``/me/accounts`` and cache it.
 
-    page_id = settings.FACEBOOK_PAGE_ID
-    resp = requests.get(
-        f"{GRAPH_URL}/me/accounts",
-        params={
-            "fields": "id,access_token",
-            "access_token": settings.META_ACCESS_TOKEN,
-        },
-        timeout=15,
-    )
-    resp.raise_for_status()
+    Serialised with a lock so concurrent callers coalesce into one request;
+    late arrivals reuse the token the first caller just stored.
+    """
+    global _page_token_cache, _page_token_cached_mono
+
+    with _page_token_lock:
+        age = _page_token_age()
+        if age is not None and age < _PAGE_TOKEN_SOFT_TTL:
+            return _page_token_cache  # type: ignore[return-value]
+
+        page_id = settings.FACEBOOK_PAGE_ID
+        resp = _SESSION.get(
+            f"{GRAPH_URL}/me/accounts",
+            params={
+                "fields": "id,access_token",
+                "access_token": settings.META_ACCESS_TOKEN,
+            },
+            timeout=15,
+        )
+        resp.raise_for_status()
 
-    for page in resp.json().get("data", []):
-        if page["id"] == page_id:
-            _page_token_cache = page["access_token"]
-            _page_token_cached_at = datetime.now(timezone.utc)
+        pages = {p["id"]: p["access_token"] for p in response_json(resp).get("data", [])}
+        token = pages.get(page_id)
+        if token:
+            _page_token_cache = token
+            _page_token_cached_mono = time.monotonic()
             logger.info("Facebook: obtained Page Access Token for page %s", page_id)
-            return _page_token_cache
+            return token
 
     raise RuntimeError(
         f"Facebook: Page {page_id} not found in /me/accounts. "
@@ -80,11 +100,42 @@ def _get_page_access_token() -> str:
     )
 
 
-def _upload_video_to_facebook(video_path: str) -> str:
-    """Upload a video file to Facebook and return the video_id."""
+def _refresh_page_token_in_background() -> None:
+    """Thread target for the soft-TTL refresh; failures are only logged."""
+    try:
+        _refresh_page_token()
+    except Exception as exc:
+        logger.warning("Facebook: background page token refresh failed: %s", exc)
+
+
+def _get_page_access_token() -> str:
+    """Exchange the user access token for a Page Access Token.
+
+    The Graph API requires a Page token (not a user token) to publish
+    content on behalf of a Page. Caches with TTL to avoid excessive API calls.
+    Between the soft and hard TTL the cached token is returned immediately
+    while a refresh runs in the background.
+    """
+    age = _page_token_age()
+    if age is not None:
+        if age < _PAGE_TOKEN_SOFT_TTL:
+            return _page_token_cache  # type: ignore[return-value]
+        if age < _PAGE_TOKEN_TTL_SECONDS:
+            if not _page_token_lock.locked():
+                threading.Thread(
+                    target=_refresh_page_token_in_background,
+                    name="fb-page-token-refresh",
+                    daemon=True,
+                ).start()
+            return _page_token_cache  # type: ignore[return-value]
+
+    return _refresh_page_token()
+
+
+def _upload_video_to_facebook(video_path: str, file_size: int) -> str:
+    """Upload a video file (of *file_size* bytes) to Facebook and return the video_id."""
     page_id = settings.FACEBOOK_PAGE_ID
     page_token = _get_page_access_token()
-    file_size = os.path.getsize(video_path)
 
     # Step 1 — Start an upload session
     start_url = f"{GRAPH_URL}/{page_id}/video_reels"
@@ -92,9 +143,9 @@ def _upload_video_to_facebook(video_path: str) -> str:
         "upload_phase": "start",
         "access_token": page_token,
     }
-    resp = requests.post(start_url, data=start_params, timeout=30)
+    resp = _SESSION.post(start_url, data=start_params, timeout=30)
     resp.raise_for_status()
-    video_id = resp.json()["video_id"]
+    video_id = response_json(resp)["video_id"]
     logger.info("Facebook: upload session started — video_id=%s", video_id)
 
     # Step 2 — Upload binary
@@ -103,12 +154,13 @@ def _upload_video_to_facebook(video_path: str) -> str:
         "Authorization": f"OAuth {page_token}",
         "offset": "0",
         "file_size": str(file_size),
+        "Content-Length": str(file_size),
     }
     with open(video_path, "rb") as f:
-        upload_resp = requests.post(
+        upload_resp = _SESSION.post(
             upload_url,
             headers=headers,
-            data=f,
+            data=ChunkedFileReader(f, file_size),  # 1 MB blocks, constant memory
             timeout=300,
         )
     upload_resp.raise_for_status()
@@ -128,16 +180,15 @@ def _publish_reel(video_id: str, caption: str) -> None:
 
     url = f"{GRAPH_URL}/{page_id}/video_reels"
     params = {
-        "upload_phase": "finish",
+        **_REEL_FINISH_PARAMS,
         "video_id": video_id,
-        "title": caption[:255] if caption else "",
+        "title": (caption or "")[:255],
         "description": caption,
-        "video_state": "PUBLISHED",
         "access_token": page_token,
     }
-    resp = requests.post(url, data=params, timeout=60)
+    resp = _SESSION.post(url, data=params, timeout=60)
     resp.raise_for_status()
-    result = resp.json()
+    result = response_json(resp)
 
     if result.get("success"):
         logger.info("Facebook: Reel published — video_id=%s", video_id)
@@ -156,8 +207,25 @@ def post_to_facebook(caption: str, video_path: str) -> bool:
         ``True`` on success, ``False`` on failure.
     """
     try:
-        video_id = _upload_video_to_facebook(video_path)
-        _publish_reel(video_id, caption)
+        # A retry of the same file reuses the earlier, unpublished upload
+        st = os.stat(video_path)
+        cache_key = file_key(video_path, st)
+        video_id = get_upload("facebook", cache_key)
+        if video_id:
+            logger.info("Facebook: reusing uploaded video_id=%s", video_id)
+        else:
+            video_id = _upload_video_to_facebook(video_path, st.st_size)
+            remember_upload("facebook", cache_key, video_id)
+        try:
+            _publish_reel(video_id, caption)
+        except requests.HTTPError as exc:
+            status = exc.response.status_code if exc.response is not None else 0
+            if 400 <= status < 500 and status != 429:
+                # Facebook rejected the asset; a retry must upload again.
+                # Timeouts, 429 and 5xx keep it for the next attempt.
+                forget_upload("facebook", cache_key)
+            raise
+        forget_upload("facebook", cache_key)
         return True
     except requests.RequestException as exc:
         logger.error("Facebook posting failed: %s", exc)
@@ -10,15 +10,18 @@ Flow:
 Ref: https://developers.facebook.com/docs/instagram-platform/instagram-api-with-instagram-login/content-publishing
 """
 
-import time
-
 import requests
 
 from app.config import settings
+from app.utils.http import build_session, response_json
 from app.utils.logger import get_logger
+from app.utils.poll import poll_until
 
 logger = get_logger(__name__)
 
+# Keep-alive session shared by every call in this module
+_SESSION = build_session()
+
 GRAPH_URL = "https://graph.facebook.com/v19.0"
 
 
@@ -39,33 +42,39 @@ def _create_container(video_url: str, caption: str) -> str:
         "share_to_feed": "true",
         "access_token": settings.META_ACCESS_TOKEN,
     }
-    resp = requests.post(url, data=params, timeout=30)
+    resp = _SESSION.post(url, data=params, timeout=30)
     resp.raise_for_status()
-    container_id: str = resp.json()["id"]
+    container_id: str = response_json(resp)["id"]
     logger.info("Instagram: container created — %s", container_id)
     return container_id
 
 
 def _wait_for_container(container_id: str, max_wait: int = 300) -> bool:
-    """Poll until the container is ready to publish."""
+    """Poll (with exponential backoff) until the container is ready to publish."""
     url = f"{GRAPH_URL}/{container_id}"
     params = {
         "fields": "status_code",
         "access_token": settings.META_ACCESS_TOKEN,
     }
-    deadline = time.time() + max_wait
-    while time.time() < deadline:
-        resp = requests.get(url, params=params, timeout=15)
+
+    def _check() -> bool | None:
+        resp = _SESSION.get(url, params=params, timeout=15)
         if resp.ok:
-            status = resp.json().get("status_code")
+            status = response_json(resp).get("status_code")
             if status == "FINISHED":
                 return True
             if status == "ERROR":
                 logger.error("Instagram: container processing failed.")
                 return False
-        time.sleep(10)
-    logger.error("Instagram: container processing timed out.")
-    return False
+        return None
+
+    # Check once right away: short clips are often FINISHED by the time the
+    # container id comes back, in which case no sleep is paid at all.
+    result = poll_until(_check, max_wait, first_delay=0.0)
+    if result is None:
+        logger.error("Instagram: container processing timed out.")
+        return False
+    return result
 
 
 def _publish(container_id: str) -> None:
@@ -75,9 +84,9 @@ def _publish(container_id: str) -> None:
         "creation_id": container_id,
         "access_token": settings.META_ACCESS_TOKEN,
     }
-    resp = requests.post(url, data=params, timeout=30)
+    resp = _SESSION.post(url, data=params, timeout=30)
     resp.raise_for_status()
-    logger.info("Instagram: Reel published — %s", resp.json().get("id"))
+    logger.info("Instagram: Reel published — %s", response_json(resp).get("id"))
 
 
 def post_to_instagram(caption: str, video_url: str) -> bool:
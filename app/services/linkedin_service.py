@@ -17,17 +17,25 @@ Flow (using the versioned REST API — ``/rest/*``):
 Ref: https://learn.microsoft.com/en-us/linkedin/marketing/community-management/shares/videos-api
 """
 
+import functools
+import mmap
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
 
 import requests
 
 from app.config import settings
+from app.utils.http import BodyPreview, build_session, post_json, response_json
 from app.utils.logger import get_logger
+from app.utils.poll import poll_until
+from app.utils.upload_cache import file_key, forget_upload, get_upload, remember_upload
 
 logger = get_logger(__name__)
 
+# Keep-alive session shared by every call in this module
+_SESSION = build_session()
+
 REST_URL = "https://api.linkedin.com/rest"
 LINKEDIN_VERSION = "202602"
 
@@ -35,10 +43,13 @@ LINKEDIN_VERSION = "202602"
 # ── Helpers ─────────────────────────────────────────────────────────
 
 
+@functools.lru_cache(maxsize=1)
 def _author_urn() -> str:
     """Return the correct author URN based on what credentials are configured.
 
-    Prefers organization posting; falls back to personal profile.
+    Prefers organization posting; falls back to personal profile.  The
+    result is memoised — call ``clear_linkedin_caches()`` after changing
+    credentials.
     """
     if settings.LINKEDIN_ORG_ID:
         return f"urn:li:organization:{settings.LINKEDIN_ORG_ID}"
@@ -52,14 +63,42 @@ def _author_urn() -> str:
     )
 
 
-def _api_headers(content_type: str = "application/json") -> dict[str, str]:
-    """Return authorization + versioning headers for the LinkedIn REST API."""
-    return {
+# Pre-built header dicts, shared (read-only) across every API call
+_HDR_BASE: dict[str, str] = {}
+_HDR_JSON: dict[str, str] = {}
+# Part PUTs go to pre-signed upload URLs, which need no auth headers
+_HDR_UPLOAD_PART = {"Content-Type": "application/octet-stream"}
+
+
+def _init_headers() -> None:
+    """(Re)build the shared header dicts from the current access token."""
+    global _HDR_BASE, _HDR_JSON
+    _HDR_BASE = {
         "Authorization": f"Bearer {settings.LINKEDIN_ACCESS_TOKEN}",
         "LinkedIn-Version": LINKEDIN_VERSION,
         "X-Restli-Protocol-Version": "2.0.0",
-        "Content-Type": content_type,
     }
+    _HDR_JSON = {**_HDR_BASE, "Content-Type": "application/json"}
+
+
+_init_headers()
+
+
+def clear_linkedin_caches() -> None:
+    """Invalidate the cached author URN and headers (call when the token rotates)."""
+    _author_urn.cache_clear()
+    _init_headers()
+    logger.info("LinkedIn: author/header caches cleared.")
+
+
+def _api_headers(content_type: str = "application/json") -> dict[str, str]:
+    """Return authorization + versioning headers for the LinkedIn REST API.
+
+    The JSON variant is a shared dict — callers must not mutate it.
+    """
+    if content_type == "application/json":
+        return _HDR_JSON
+    return {**_HDR_BASE, "Content-Type": content_type}
 
 
 # ── Video upload (REST API) ────────────────────────────────────────
@@ -78,20 +117,21 @@ def _init_upload(file_size: int) -> dict:
         }
     }
 
-    resp = requests.post(
+    resp = post_json(
+        _SESSION,
         f"{REST_URL}/videos?action=initializeUpload",
-        json=payload,
+        payload,
         headers=_api_headers(),
         timeout=30,
     )
 
     if not resp.ok:
         logger.error(
-            "LinkedIn video init failed: %d %s", resp.status_code, resp.text[:500]
+            "LinkedIn video init failed: %d %s", resp.status_code, BodyPreview(resp)
         )
         resp.raise_for_status()
 
-    data = resp.json()["value"]
+    data = response_json(resp)["value"]
     logger.info(
         "LinkedIn: video initialized — %s (owner=%s, parts=%d)",
         data["video"],
@@ -101,46 +141,68 @@ def _init_upload(file_size: int) -> dict:
     return data
 
 
-def _upload_chunks(video_path: str, init_data: dict) -> list[str]:
-    """Upload binary chunks and return the list of ETags."""
-    with open(video_path, "rb") as fh:
-        video_bytes = fh.read()
+# Upper bound on concurrent part uploads — keeps small instances from
+# saturating their uplink on very large multi-part videos.
+_MAX_PARALLEL_PARTS = 4
 
-    etags: list[str] = []
-    instructions = init_data.get("uploadInstructions", [])
 
-    for idx, instr in enumerate(instructions):
-        upload_url = instr["uploadUrl"]
-        first_byte = instr.get("firstByte", 0)
-        last_byte = instr.get("lastByte", len(video_bytes) - 1)
-        chunk = video_bytes[first_byte : last_byte + 1]
+def _upload_part(view: memoryview, idx: int, total: int, instr: dict) -> str:
+    """PUT one part of the video and return its ETag."""
+    upload_url = instr["uploadUrl"]
+    first_byte = instr.get("firstByte", 0)
+    last_byte = instr.get("lastByte", len(view) - 1)
 
+    with view[first_byte : last_byte + 1] as chunk:
         logger.info(
             "LinkedIn: uploading part %d/%d (%s bytes)",
             idx + 1,
-            len(instructions),
+            total,
             f"{len(chunk):,}",
         )
 
-        resp = requests.put(
+        resp = _SESSION.put(
             upload_url,
             data=chunk,
-            headers={"Content-Type": "application/octet-stream"},
+            headers=_HDR_UPLOAD_PART,
             timeout=300,
         )
 
-        if not resp.ok:
-            logger.error(
-                "LinkedIn chunk upload failed (part %d): %d %s",
-                idx + 1,
-                resp.status_code,
-                resp.text[:500],
-            )
-            resp.raise_for_status()
+    if not resp.ok:
+        logger.error(
+            "LinkedIn chunk upload failed (part %d): %d %s",
+            idx + 1,
+            resp.status_code,
+            BodyPreview(resp),
+        )
+        resp.raise_for_status()
 
-        etag = resp.headers.get("ETag", "")
-        if etag:
-            etags.append(etag)
+    etag = resp.headers.get("ETag")
+    if not etag:
+        # finalizeUpload needs one id per part, in order — fail loudly
+        raise requests.HTTPError(
+            f"LinkedIn part {idx + 1} response has no ETag", response=resp
+        )
+    return etag
+
+
+def _upload_chunks(view: memoryview, instructions: list[dict]) -> list[str]:
+    """Upload binary chunks from an already-mapped file and return the ETags.
+
+    Each part is sent as a zero-copy ``memoryview`` slice of *view*, so the
+    video is never loaded into RAM.  Parts go to independent upload URLs,
+    so they are sent in parallel; ETags are returned in part order as
+    ``finalizeUpload`` requires.
+    """
+    total = len(instructions)
+    workers = max(1, min(_MAX_PARALLEL_PARTS, total))
+    etags: list[str] = [""] * total
+
+    def _send(idx: int) -> None:
+        etags[idx] = _upload_part(view, idx, total, instructions[idx])
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="linkedin-part") as pool:
+        # list() re-raises the first failed part
+        list(pool.map(_send, range(total)))
 
     return etags
 
@@ -154,9 +216,10 @@ def _finalize_upload(video_urn: str, upload_token: str, etags: list[str]) -> Non
             "uploadedPartIds": etags,
         }
     }
-    resp = requests.post(
+    resp = post_json(
+        _SESSION,
         f"{REST_URL}/videos?action=finalizeUpload",
-        json=payload,
+        payload,
         headers=_api_headers(),
         timeout=30,
     )
@@ -164,27 +227,31 @@ def _finalize_upload(video_urn: str, upload_token: str, etags: list[str]) -> Non
         logger.error(
             "LinkedIn video finalize failed: %d %s",
             resp.status_code,
-            resp.text[:500],
+            BodyPreview(resp),
         )
         resp.raise_for_status()
     logger.info("LinkedIn: video upload finalized.")
 
 
-def _wait_for_processing(video_urn: str, max_wait: int = 300) -> bool:
-    """Poll ``/rest/videos/{urn}`` until the video is ``AVAILABLE``."""
+def _wait_for_processing(video_urn: str, max_wait: int = 300) -> bool | None:
+    """Poll ``/rest/videos/{urn}`` (with exponential backoff) until ``AVAILABLE``.
+
+    Returns True when available, False if processing failed and None on
+    timeout (the asset may still become usable).
+    """
     encoded_urn = quote(video_urn, safe="")
     url = f"{REST_URL}/videos/{encoded_urn}"
-    headers = {
-        "Authorization": f"Bearer {settings.LINKEDIN_ACCESS_TOKEN}",
-        "LinkedIn-Version": LINKEDIN_VERSION,
-        "X-Restli-Protocol-Version": "2.0.0",
-    }
-
-    deadline = time.time() + max_wait
-    while time.time() < deadline:
-        resp = requests.get(url, headers=headers, timeout=15)
+    headers = _HDR_BASE
+
+    def _check() -> bool | None:
+        try:
+            resp = _SESSION.get(url, headers=headers, timeout=15)
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            # A dropped status poll says nothing about the video; keep waiting
+            logger.warning("LinkedIn: video status poll error: %s", exc)
+            return None
         if resp.ok:
-            status = resp.json().get("status", "unknown")
+            status = response_json(resp).get("status", "unknown")
             logger.debug("LinkedIn video status: %s", status)
             if status == "AVAILABLE":
                 return True
@@ -197,40 +264,43 @@ def _wait_for_processing(video_urn: str, max_wait: int = 300) -> bool:
             logger.warning(
                 "LinkedIn: video status poll %d %s",
                 resp.status_code,
-                resp.text[:200],
+                BodyPreview(resp, 200),
             )
-        time.sleep(10)
-    return False
+        return None
+
+    return poll_until(_check, max_wait)
 
 
 # ── Post creation (REST API) ──────────────────────────────────────
 
+# Fields identical for every post; only serialised, never mutated
+_POST_TEMPLATE = {
+    "visibility": "PUBLIC",
+    "distribution": {
+        "feedDistribution": "MAIN_FEED",
+        "targetEntities": [],
+        "thirdPartyDistributionChannels": [],
+    },
+    "lifecycleState": "PUBLISHED",
+    "isReshareDisabledByAuthor": False,
+}
+
 
 def _create_post(video_urn: str, caption: str) -> None:
     """Create a post referencing the uploaded video via ``/rest/posts``."""
     author = _author_urn()
 
     payload = {
+        **_POST_TEMPLATE,
         "author": author,
         "commentary": caption,
-        "visibility": "PUBLIC",
-        "distribution": {
-            "feedDistribution": "MAIN_FEED",
-            "targetEntities": [],
-            "thirdPartyDistributionChannels": [],
-        },
-        "content": {
-            "media": {
-                "id": video_urn,
-            }
-        },
-        "lifecycleState": "PUBLISHED",
-        "isReshareDisabledByAuthor": False,
+        "content": {"media": {"id": video_urn}},
     }
 
-    resp = requests.post(
+    resp = post_json(
+        _SESSION,
         f"{REST_URL}/posts",
-        json=payload,
+        payload,
         headers=_api_headers(),
         timeout=30,
     )
@@ -239,7 +309,7 @@ def _create_post(video_urn: str, caption: str) -> None:
         logger.error(
             "LinkedIn post creation failed: %d %s",
             resp.status_code,
-            resp.text[:500],
+            BodyPreview(resp),
         )
         resp.raise_for_status()
 
@@ -264,30 +334,53 @@ def post_to_linkedin(caption: str, video_path: str) -> bool:
         ``True`` on success, ``False`` on failure.
     """
     try:
-        file_size = os.path.getsize(video_path)
+        st = os.stat(video_path)
+        if not st.st_size:
+            # Nothing to upload (and an empty file can't be mapped)
+            logger.error("LinkedIn: video file is empty — %s", video_path)
+            return False
 
-        logger.info(
-            "LinkedIn: initializing upload (%s bytes) as %s...",
-            f"{file_size:,}",
-            _author_urn(),
-        )
-        init_data = _init_upload(file_size)
-        video_urn = init_data["video"]
-        upload_token = init_data.get("uploadToken", "")
+        # A retry of the same file reuses the earlier, unpublished upload
+        cache_key = file_key(video_path, st)
+        video_urn = get_upload("linkedin", cache_key)
+
+        if video_urn:
+            logger.info("LinkedIn: reusing uploaded video %s", video_urn)
+        else:
+            # Map the file once; its size and every part slice come from the
+            # same mapping (no full read()).
+            with open(video_path, "rb") as fh, mmap.mmap(
+                fh.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm, memoryview(mm) as view:
+                file_size = len(view)
+                logger.info(
+                    "LinkedIn: initializing upload (%s bytes) as %s...",
+                    f"{file_size:,}",
+                    _author_urn(),
+                )
+                init_data = _init_upload(file_size)
+                video_urn = init_data["video"]
+                upload_token = init_data.get("uploadToken", "")
 
-        logger.info("LinkedIn: uploading video chunks...")
-        etags = _upload_chunks(video_path, init_data)
+                logger.info("LinkedIn: uploading video chunks...")
+                etags = _upload_chunks(view, init_data.get("uploadInstructions", []))
 
-        logger.info("LinkedIn: finalizing upload...")
-        _finalize_upload(video_urn, upload_token, etags)
+                logger.info("LinkedIn: finalizing upload...")
+                _finalize_upload(video_urn, upload_token, etags)
+                remember_upload("linkedin", cache_key, video_urn)
 
         logger.info("LinkedIn: waiting for processing...")
-        if not _wait_for_processing(video_urn):
+        ready = _wait_for_processing(video_urn)
+        if not ready:
+            if ready is False:
+                # LinkedIn rejected the asset; a retry must upload again
+                forget_upload("linkedin", cache_key)
             logger.error("LinkedIn: video processing timed out or failed.")
             return False
 
         logger.info("LinkedIn: creating post...")
         _create_post(video_urn, caption)
+        forget_upload("linkedin", cache_key)
 
         logger.info("LinkedIn: post published successfully.")
         return True
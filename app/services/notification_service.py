@@ -10,13 +10,22 @@ Both are optional — if the webhook/token isn't configured, that channel is
 silently skipped.
 """
 
-import requests
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from app.config import settings
+from app.utils.http import build_session, post_json
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keep-alive session shared by every call in this module
+_SESSION = build_session()
+
+# Discord and Telegram are independent; one slow channel shouldn't delay the other
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="notify")
+_SEND_TIMEOUT = 10
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 def _send_discord(message: str, color: int = 0x00FF00) -> None:
     """Send a rich embed to a Discord channel via webhook."""
@@ -34,7 +43,7 @@ def _send_discord(message: str, color: int = 0x00FF00) -> None:
         ]
     }
     try:
-        resp = requests.post(url, json=payload, timeout=10)
+        resp = post_json(_SESSION, url, payload, headers=_JSON_HEADERS, timeout=_SEND_TIMEOUT)
         if resp.ok:
             logger.debug("Discord notification sent.")
         else:
@@ -57,7 +66,7 @@ def _send_telegram(message: str) -> None:
         "parse_mode": "HTML",
     }
     try:
-        resp = requests.post(url, json=payload, timeout=10)
+        resp = post_json(_SESSION, url, payload, headers=_JSON_HEADERS, timeout=_SEND_TIMEOUT)
         if resp.ok:
             logger.debug("Telegram notification sent.")
         else:
@@ -66,42 +75,56 @@ def _send_telegram(message: str) -> None:
         logger.warning("Telegram notification failed: %s", exc)
 
 
+def _broadcast(message: str, color: int) -> None:
+    """Send *message* to Discord and Telegram concurrently.
+
+    Returns once both have finished (each send logs its own errors).
+    """
+    futures = [
+        _EXECUTOR.submit(_send_discord, message, color),
+        _EXECUTOR.submit(_send_telegram, message),
+    ]
+    wait(futures, timeout=_SEND_TIMEOUT + 2)
+
+
+_STATUS_ICONS = {"SUCCESS": "✅", "SKIPPED": "⏭"}  # anything else is a failure
+
+
+def _platform_lines(platforms: dict) -> list[str]:
+    """One ``icon platform: status`` line per platform."""
+    return [
+        f"  {_STATUS_ICONS.get(status, '❌')} {platform}: {status}"
+        for platform, status in platforms.items()
+    ]
+
+
 # ── Public helpers ────────────────────────────────────────────────────────────
 
 def notify_success(tool_name: str, tool_id: int, platforms: dict) -> None:
     """Send a success notification with per-platform breakdown."""
-    lines = [f"✅ <b>{tool_name}</b> (#{tool_id}) posted successfully!"]
-    for platform, status in platforms.items():
-        icon = "✅" if status == "SUCCESS" else ("⏭" if status == "SKIPPED" else "❌")
-        lines.append(f"  {icon} {platform}: {status}")
-
-    msg = "\n".join(lines)
-    _send_discord(msg, color=0x00FF00)  # green
-    _send_telegram(msg)
+    msg = "\n".join([
+        f"✅ <b>{tool_name}</b> (#{tool_id}) posted successfully!",
+        *_platform_lines(platforms),
+    ])
+    _broadcast(msg, color=0x00FF00)  # green
 
 
 def notify_failure(tool_name: str, tool_id: int, platforms: dict, error: str = "") -> None:
     """Send a failure notification."""
-    lines = [f"❌ <b>{tool_name}</b> (#{tool_id}) FAILED"]
-    for platform, status in platforms.items():
-        icon = "✅" if status == "SUCCESS" else ("⏭" if status == "SKIPPED" else "❌")
-        lines.append(f"  {icon} {platform}: {status}")
+    lines = [f"❌ <b>{tool_name}</b> (#{tool_id}) FAILED", *_platform_lines(platforms)]
     if error:
         lines.append(f"\nError: {error}")
 
     msg = "\n".join(lines)
-    _send_discord(msg, color=0xFF0000)  # red
-    _send_telegram(msg)
+    _broadcast(msg, color=0xFF0000)  # red
 
 
 def notify_token_expiry(platform: str, days_left: int) -> None:
     """Warn about an upcoming token expiration."""
     msg = f"⚠️ <b>{platform}</b> token expires in <b>{days_left} days</b>! Refresh it soon."
-    _send_discord(msg, color=0xFFA500)  # orange
-    _send_telegram(msg)
+    _broadcast(msg, color=0xFFA500)  # orange
 
 
 def notify_info(message: str) -> None:
     """Send a generic informational notification."""
-    _send_discord(message, color=0x3498DB)  # blue
-    _send_telegram(message)
+    _broadcast(message, color=0x3498DB)  # blue
@@ -11,40 +11,96 @@ Required env vars:
   REDDIT_SUBREDDIT       — target subreddit (without r/, e.g. "AItools")
 """
 
+import json
 import os
+import stat
 import time
+from typing import NamedTuple, Optional
+
 import requests
 
 from app.config import settings
+from app.utils.http import build_session, response_json
 from app.utils.logger import get_logger
+from app.utils.streaming import MultipartFileStream
 
 logger = get_logger(__name__)
 
-_USER_AGENT = "ExecutionPosting/1.0 (by /u/{})".format(
-    getattr(settings, "REDDIT_USERNAME", "bot")
-)
+# Keep-alive session shared by every call in this module
+_SESSION = build_session()
+
+_USER_AGENT = "ExecutionPosting/1.0 (by /u/{})".format(settings.REDDIT_USERNAME or "bot")
+
+
+class _RedditCreds(NamedTuple):
+    """Reddit script-app credentials, resolved once at import."""
+
+    client_id: str
+    client_secret: str
+    username: str
+    password: str
+
+
+def _load_creds() -> Optional[_RedditCreds]:
+    """Resolve the script-app credentials once; ``None`` if any are missing."""
+    values = (
+        settings.REDDIT_CLIENT_ID,
+        settings.REDDIT_CLIENT_SECRET,
+        settings.REDDIT_USERNAME,
+        settings.REDDIT_PASSWORD,
+    )
+    return _RedditCreds(*values) if all(values) else None
+
+
+_CREDS = _load_creds()
+_SUBREDDIT = settings.REDDIT_SUBREDDIT
 
-# Cache the OAuth token
+# Cache the OAuth token (mirrored to disk so restarts can reuse it)
 _token_cache: dict = {"token": None, "expires": 0}
+_TOKEN_FILE = os.path.join(os.path.expanduser("~"), ".cache", "autopost", "reddit_token.json")
+
+
+def _load_token_file(username: str) -> None:
+    """Populate ``_token_cache`` from disk if a token for *username* is saved."""
+    try:
+        with open(_TOKEN_FILE, encoding="utf-8") as fh:
+            saved = json.load(fh)
+    except (OSError, ValueError):
+        return
+    if saved.get("username") == username and saved.get("token"):
+        _token_cache["token"] = saved["token"]
+        _token_cache["expires"] = float(saved.get("expires", 0))
+
+
+def _save_token_file(username: str) -> None:
+    """Atomically write ``_token_cache`` to disk (owner-readable only)."""
+    try:
+        os.makedirs(os.path.dirname(_TOKEN_FILE), exist_ok=True)
+        tmp_path = f"{_TOKEN_FILE}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump({"username": username, **_token_cache}, fh)
+        os.replace(tmp_path, _TOKEN_FILE)
+    except OSError as exc:
+        logger.warning("Reddit: could not persist OAuth token: %s", exc)
 
 
 def _get_access_token() -> str | None:
     """Obtain a Reddit OAuth2 access token using password grant."""
-    client_id = getattr(settings, "REDDIT_CLIENT_ID", None)
-    client_secret = getattr(settings, "REDDIT_CLIENT_SECRET", None)
-    username = getattr(settings, "REDDIT_USERNAME", None)
-    password = getattr(settings, "REDDIT_PASSWORD", None)
-
-    if not all([client_id, client_secret, username, password]):
+    creds = _CREDS
+    if creds is None:
         logger.error("Reddit: missing credentials (CLIENT_ID/SECRET/USERNAME/PASSWORD).")
         return None
+    client_id, client_secret, username, password = creds
 
     now = time.time()
+    if not _token_cache["token"]:
+        _load_token_file(username)
     if _token_cache["token"] and now < _token_cache["expires"]:
         return _token_cache["token"]
 
     try:
-        resp = requests.post(
+        resp = _SESSION.post(
             "https://www.reddit.com/api/v1/access_token",
             auth=(client_id, client_secret),
             data={
@@ -60,7 +116,7 @@ def _get_access_token() -> str | None:
             logger.error("Reddit auth failed (%d): %s", resp.status_code, resp.text)
             return None
 
-        data = resp.json()
+        data = response_json(resp)
         token = data.get("access_token")
         expires_in = data.get("expires_in", 3600)
 
@@ -70,6 +126,7 @@ def _get_access_token() -> str | None:
 
         _token_cache["token"] = token
         _token_cache["expires"] = now + expires_in - 60  # refresh 60s early
+        _save_token_file(username)
 
         logger.info("Reddit: obtained OAuth token (expires in %ds).", expires_in)
         return token
@@ -97,14 +154,20 @@ def post_to_reddit(caption: str, video_path: str, tool_name: str = "") -> bool:
     Returns:
         True on success, False on failure.
     """
-    subreddit = getattr(settings, "REDDIT_SUBREDDIT", None)
+    subreddit = _SUBREDDIT
     if not subreddit:
         logger.error("Reddit: REDDIT_SUBREDDIT not configured.")
         return False
 
-    if not os.path.isfile(video_path):
+    # One stat() gives both the existence check and the upload size
+    try:
+        st = os.stat(video_path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         logger.error("Reddit: video file not found: %s", video_path)
         return False
+    file_size = st.st_size
 
     token = _get_access_token()
     if not token:
@@ -115,11 +178,10 @@ def post_to_reddit(caption: str, video_path: str, tool_name: str = "") -> bool:
 
     try:
         # Step 1: Get upload lease from Reddit
-        file_size = os.path.getsize(video_path)
         file_name = os.path.basename(video_path)
         mime = "video/mp4"
 
-        resp = requests.post(
+        resp = _SESSION.post(
             "https://oauth.reddit.com/api/media/asset.json",
             headers=headers,
             data={
@@ -133,7 +195,7 @@ def post_to_reddit(caption: str, video_path: str, tool_name: str = "") -> bool:
             logger.error("Reddit upload lease failed (%d): %s", resp.status_code, resp.text)
             return False
 
-        lease = resp.json()
+        lease = response_json(resp)
         asset = lease.get("asset", {})
         upload_url = "https:" + asset.get("upload_url", "")
         asset_id = asset.get("asset_id", "")
@@ -145,10 +207,12 @@ def post_to_reddit(caption: str, video_path: str, tool_name: str = "") -> bool:
 
         # Step 2: Upload the file to Reddit's S3
         with open(video_path, "rb") as vf:
-            resp2 = requests.post(
+            # Streamed multipart body — files= would read the whole video into RAM
+            body = MultipartFileStream(fields, "file", file_name, mime, vf, file_size)
+            resp2 = _SESSION.post(
                 upload_url,
-                data=fields,
-                files={"file": (file_name, vf, mime)},
+                data=body,
+                headers=body.headers,
                 timeout=180,
             )
 
@@ -173,7 +237,7 @@ def post_to_reddit(caption: str, video_path: str, tool_name: str = "") -> bool:
             "api_type": "json",
         }
 
-        resp3 = requests.post(
+        resp3 = _SESSION.post(
             "https://oauth.reddit.com/api/submit",
             headers=headers,
             data=submit_data,
@@ -184,14 +248,15 @@ def post_to_reddit(caption: str, video_path: str, tool_name: str = "") -> bool:
             logger.error("Reddit submit failed (%d): %s", resp3.status_code, resp3.text[:300])
             return False
 
-        result = resp3.json()
-        errors = result.get("json", {}).get("errors", [])
+        result = response_json(resp3).get("json", {})
+        errors = result.get("errors", [])
         if errors:
             logger.error("Reddit submit errors: %s", errors)
             return False
 
-        post_url = result.get("json", {}).get("data", {}).get("url", "")
-        post_id = result.get("json", {}).get("data", {}).get("id", "?")
+        post_data = result.get("data", {})
+        post_url = post_data.get("url", "")
+        post_id = post_data.get("id", "?")
         logger.info("Reddit: posted to r/%s (id=%s, url=%s)", subreddit, post_id, post_url)
         return True
 
@@ -51,28 +51,58 @@ OPTIMAL_HOURS = {
 # Minimum hours between posts to the same platform
 COOLDOWN_HOURS = 4
 
+# English day names indexed by ``datetime.weekday()`` (locale-independent,
+# unlike ``strftime("%A")``)
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
 
-def suggest_posting_time(
-    platform: Optional[str] = None,
-    last_posted_at: Optional[datetime] = None,
-    now: Optional[datetime] = None,
-) -> dict:
-    """Suggest the next optimal posting time.
 
-    Args:
-        platform: Specific platform name, or None for general best time.
-        last_posted_at: When the last post was made (for cooldown).
-        now: Current time (defaults to UTC now).
+def _build_score_tables(config: dict) -> tuple[tuple[list[int], list[int]], int]:
+    """Precompute per-hour base scores and a best-day bitmask for one platform.
 
-    Returns:
-        {
-            "suggested_time": "2025-01-15T14:00:00Z",
-            "reason": "Best time for Instagram on Wednesday",
-            "day_name": "Wednesday",
-            "hour": 14,
-            "is_prime_time": True,
-        }
+    Returns ``((weekday_scores, weekend_scores), best_days_mask)`` where each
+    score list has 24 entries: ``10 + rank bonus`` for optimal hours (earlier
+    entries rank higher), ``0`` otherwise.
+    """
+    tables = []
+    for key in ("weekday", "weekend"):
+        hours = config[key]
+        scores = [0] * 24
+        for idx, hour in enumerate(hours):
+            if not scores[hour]:
+                scores[hour] = 10 + len(hours) - idx
+        tables.append(scores)
+
+    best_days_mask = 0
+    for day in config.get("best_days", range(7)):
+        best_days_mask |= 1 << day
+    return (tables[0], tables[1]), best_days_mask
+
+
+# Built once at import so the candidate loop is a list index + bit test
+_SCORE_TABLES = {plat: _build_score_tables(cfg) for plat, cfg in OPTIMAL_HOURS.items()}
+
+
+def _candidate_slots(earliest: datetime) -> tuple[datetime, list[tuple[int, int, int, bool]]]:
+    """The next 48 whole-hour slots at/after *earliest*.
+
+    Returns ``(start, slots)`` where *start* is *earliest* floored to the
+    hour and each slot is ``(hour_offset, hour, weekday, is_weekend)``.
+    Slots are plain integers derived from *start* — only the winning one
+    is turned back into a ``datetime`` — and are shared by every platform.
     """
+    start = earliest.replace(minute=0, second=0, microsecond=0)
+    base_weekday = start.weekday()  # 0=Mon
+    slots = []
+    # Check the next 48 hours in 1-hour increments
+    for hour_offset in range(0 if start == earliest else 1, 48):
+        days, hour = divmod(start.hour + hour_offset, 24)
+        weekday = (base_weekday + days) % 7
+        slots.append((hour_offset, hour, weekday, weekday >= 5))
+    return start, slots
+
+
+def _earliest_slot(now: Optional[datetime], last_posted_at: Optional[datetime]) -> datetime:
+    """Earliest allowed posting time: 5 min from *now*, after any cooldown."""
     if now is None:
         now = datetime.now(timezone.utc)
 
@@ -82,63 +112,88 @@ def suggest_posting_time(
         cooldown_end = last_posted_at + timedelta(hours=COOLDOWN_HOURS)
         if cooldown_end > earliest:
             earliest = cooldown_end
+    return earliest
 
-    platforms = [platform] if platform else list(OPTIMAL_HOURS.keys())
 
-    best_time = None
+def _best_slot(
+    platforms: list,
+    earliest: datetime,
+    candidates: tuple[datetime, list[tuple[int, int, int, bool]]],
+) -> dict:
+    """Score *candidates* for *platforms* and build the suggestion dict."""
+    start, slots = candidates
+    best_offset = None
     best_score = -1
-    best_reason = ""
     best_platform = ""
 
     for plat in platforms:
-        hours_config = OPTIMAL_HOURS.get(plat, OPTIMAL_HOURS["instagram"])
-        best_days = hours_config.get("best_days", list(range(7)))
-
-        # Check the next 48 hours in 1-hour increments
-        for hour_offset in range(48):
-            candidate = earliest.replace(minute=0, second=0, microsecond=0) + timedelta(hours=hour_offset)
-            if candidate < earliest:
-                continue
-
-            weekday = candidate.weekday()  # 0=Mon
-            hour = candidate.hour
-            is_weekend = weekday >= 5
-
-            optimal_hours = hours_config["weekend"] if is_weekend else hours_config["weekday"]
+        (weekday_scores, weekend_scores), best_days_mask = _SCORE_TABLES.get(
+            plat, _SCORE_TABLES["instagram"]
+        )
 
-            score = 0
-            if hour in optimal_hours:
-                score += 10
-                # Boost for best days
-                if weekday in best_days:
-                    score += 5
-                # Slight preference for earlier optimal slots
-                score += (len(optimal_hours) - optimal_hours.index(hour))
+        for hour_offset, hour, weekday, is_weekend in slots:
+            # 10 + preference for earlier optimal slots, or 0 off-peak
+            score = (weekend_scores if is_weekend else weekday_scores)[hour]
+            # Boost for best days
+            if score and best_days_mask >> weekday & 1:
+                score += 5
 
             if score > best_score:
                 best_score = score
-                best_time = candidate
+                best_offset = hour_offset
                 best_platform = plat
-                day_name = candidate.strftime("%A")
-                if score >= 10:
-                    best_reason = f"Peak engagement for {plat.title()} on {day_name} at {hour}:00 UTC"
-                else:
-                    best_reason = f"Next available slot for {plat.title()}"
 
-    if best_time is None:
+    if best_offset is None:
         best_time = earliest
+        day_name = _DAY_NAMES[best_time.weekday()]
         best_reason = "No optimal slot found — using next available time"
+    else:
+        best_time = start + timedelta(hours=best_offset)
+        day_name = _DAY_NAMES[best_time.weekday()]
+        if best_score >= 10:
+            best_reason = (
+                f"Peak engagement for {best_platform.title()} on "
+                f"{day_name} at {best_time.hour}:00 UTC"
+            )
+        else:
+            best_reason = f"Next available slot for {best_platform.title()}"
 
     return {
         "suggested_time": best_time.isoformat(),
         "reason": best_reason,
         "platform": best_platform,
-        "day_name": best_time.strftime("%A"),
+        "day_name": day_name,
         "hour": best_time.hour,
         "is_prime_time": best_score >= 10,
     }
 
 
+def suggest_posting_time(
+    platform: Optional[str] = None,
+    last_posted_at: Optional[datetime] = None,
+    now: Optional[datetime] = None,
+) -> dict:
+    """Suggest the next optimal posting time.
+
+    Args:
+        platform: Specific platform name, or None for general best time.
+        last_posted_at: When the last post was made (for cooldown).
+        now: Current time (defaults to UTC now).
+
+    Returns:
+        {
+            "suggested_time": "2025-01-15T14:00:00Z",
+            "reason": "Best time for Instagram on Wednesday",
+            "day_name": "Wednesday",
+            "hour": 14,
+            "is_prime_time": True,
+        }
+    """
+    earliest = _earliest_slot(now, last_posted_at)
+    platforms = [platform] if platform else list(OPTIMAL_HOURS.keys())
+    return _best_slot(platforms, earliest, _candidate_slots(earliest))
+
+
 def get_schedule_suggestions(
     last_posted_at: Optional[datetime] = None,
     now: Optional[datetime] = None,
@@ -147,14 +202,10 @@ def get_schedule_suggestions(
 
     Returns a list of suggestion dicts, one per platform, sorted by time.
     """
-    suggestions = []
-    for platform in OPTIMAL_HOURS:
-        suggestion = suggest_posting_time(
-            platform=platform,
-            last_posted_at=last_posted_at,
-            now=now,
-        )
-        suggestions.append(suggestion)
+    # The candidate window is the same for every platform — build it once
+    earliest = _earliest_slot(now, last_posted_at)
+    slots = _candidate_slots(earliest)
+    suggestions = [_best_slot([platform], earliest, slots) for platform in OPTIMAL_HOURS]
 
     # Sort by suggested time
     suggestions.sort(key=lambda s: s["suggested_time"])
@@ -173,37 +224,40 @@ def check_content_freshness(
     """
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(days=days_threshold)
+    target = tool_name.strip().lower()
 
     for existing in existing_tools:
-        if (
-            existing.get("tool_name", "").strip().lower() == tool_name.strip().lower()
-            and existing.get("status") == "POSTED"
-        ):
-            posted_at = existing.get("posted_at")
-            if posted_at and isinstance(posted_at, str):
-                try:
-                    posted_dt = datetime.fromisoformat(posted_at.replace("Z", "+00:00"))
-                except ValueError:
-                    continue
-            elif isinstance(posted_at, datetime):
-                posted_dt = posted_at
-            else:
+        # Cheap status test first; only POSTED rows get name-normalised
+        if existing.get("status") != "POSTED":
+            continue
+        if (existing.get("tool_name") or "").strip().lower() != target:
+            continue
+
+        posted_at = existing.get("posted_at")
+        if posted_at and isinstance(posted_at, str):
+            try:
+                posted_dt = datetime.fromisoformat(posted_at.replace("Z", "+00:00"))
+            except ValueError:
                 continue
-
-            if posted_dt > cutoff:
-                days_ago = (now - posted_dt).days
-                return {
-                    "type": "freshness",
-                    "severity": "warning",
-                    "message": (
-                        f"'{tool_name}' was posted {days_ago} day(s) ago. "
-                        f"Posting the same tool within {days_threshold} days may "
-                        f"reduce engagement and appear as spam."
-                    ),
-                    "existing_id": existing.get("id"),
-                    "posted_at": posted_dt.isoformat(),
-                    "days_ago": days_ago,
-                }
+        elif isinstance(posted_at, datetime):
+            posted_dt = posted_at
+        else:
+            continue
+
+        if posted_dt > cutoff:
+            days_ago = (now - posted_dt).days
+            return {
+                "type": "freshness",
+                "severity": "warning",
+                "message": (
+                    f"'{tool_name}' was posted {days_ago} day(s) ago. "
+                    f"Posting the same tool within {days_threshold} days may "
+                    f"reduce engagement and appear as spam."
+                ),
+                "existing_id": existing.get("id"),
+                "posted_at": posted_dt.isoformat(),
+                "days_ago": days_ago,
+            }
 
     return None
 
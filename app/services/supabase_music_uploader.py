@@ -4,11 +4,14 @@ Supabase music uploader service.
 Uploads royalty-free music files to the configured Supabase Storage bucket.
 """
 
+import functools
 from pathlib import Path
 
-import requests
-
 from app.config import settings
+from app.utils.http import build_session, post_json, response_json
+
+# Keep-alive session shared by every call in this module
+_SESSION = build_session()
 
 
 class SupabaseMusicUploadError(Exception):
@@ -18,8 +21,12 @@ class SupabaseMusicUploadError(Exception):
 _AUDIO_EXTENSIONS = {".mp3", ".wav", ".ogg", ".m4a", ".flac", ".aac"}
 
 
+@functools.lru_cache(maxsize=1)
 def _get_base_config() -> tuple[str, str, str]:
-    """Return (base_url, api_key, bucket) for storage operations."""
+    """Return (base_url, api_key, bucket) for storage operations.
+
+    Resolved once per process; a missing config raises and is not cached.
+    """
     base_url = (settings.SUPABASE_URL or "").strip()
     raw_key = settings.SUPABASE_SERVICE_ROLE_KEY or settings.SUPABASE_ANON_KEY
     api_key = (raw_key or "").strip()
@@ -57,7 +64,7 @@ def upload_music_to_supabase(
         "x-upsert": "true" if upsert else "false",
     }
 
-    response = requests.post(upload_url, headers=headers, data=file_bytes, timeout=90)
+    response = _SESSION.post(upload_url, headers=headers, data=file_bytes, timeout=90)
 
     if not response.ok:
         message = (
@@ -83,12 +90,14 @@ def list_music_in_supabase(*, folder: str | None = None, limit: int = 200) -> li
     clean_folder = (folder or "").strip("/")
     list_url = f"{base_url}/storage/v1/object/list/{bucket}"
 
-    response = requests.post(
+    response = post_json(
+        _SESSION,
         list_url,
-        json={"prefix": clean_folder, "limit": limit, "offset": 0},
+        {"prefix": clean_folder, "limit": limit, "offset": 0},
         headers={
             "apikey": api_key,
             "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
         },
         timeout=30,
     )
@@ -100,7 +109,8 @@ def list_music_in_supabase(*, folder: str | None = None, limit: int = 200) -> li
         )
         raise SupabaseMusicUploadError(message)
 
-    objects = response.json() if isinstance(response.json(), list) else []
+    payload = response_json(response)
+    objects = payload if isinstance(payload, list) else []
     items: list[dict] = []
 
     for item in objects:
@@ -134,7 +144,7 @@ def delete_music_from_supabase(*, object_path: str) -> dict:
         raise SupabaseMusicUploadError("Missing object path to delete.")
 
     delete_url = f"{base_url}/storage/v1/object/{bucket}"
-    response = requests.delete(
+    response = _SESSION.delete(
         delete_url,
         json={"prefixes": [clean_path]},
         headers={
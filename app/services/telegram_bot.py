@@ -1,8 +1,8 @@
 """
 Telegram Bot — Bidirectional communication.
 
-Runs a polling loop in the scheduler that checks for new messages
-from the configured TELEGRAM_CHAT_ID and responds to commands:
+Runs a long-polling loop in a background thread that checks for new
+messages from the configured TELEGRAM_CHAT_ID and responds to commands:
 
   /status      — current queue & posting summary
   /recent      — last 5 posted tools
@@ -14,17 +14,35 @@ from the configured TELEGRAM_CHAT_ID and responds to commands:
 All responses are sent back to the same chat.
 """
 
-import requests
+import threading
+import time
 from datetime import datetime, timezone
+from operator import attrgetter
 
 from app.config import settings
+from app.utils.http import build_session
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keep-alive session shared by every call in this module; TCP keepalive
+# probes stop NATs from dropping the idle getUpdates long-poll
+_SESSION = build_session(tcp_keepalive=True)
+
 # Track the last update_id we've processed (avoid re-processing)
 _last_update_id: int = 0
 
+# getUpdates holds the request open server-side for up to this long, so new
+# commands are answered immediately and idle periods cost one request / 25s
+_LONG_POLL_SECONDS = 25
+_POLL_ERROR_BACKOFF_SECONDS = 5
+_poll_stop = threading.Event()
+_poll_thread: threading.Thread | None = None
+
+# (token, fetched_at monotonic, debug_token data) for the /health command
+_META_HEALTH_TTL_SECONDS = 3600
+_meta_health_cache: tuple[str, float, dict] | None = None
+
 BOT_TOKEN = None
 CHAT_ID = None
 
@@ -35,7 +53,7 @@ def _init():
     CHAT_ID = settings.TELEGRAM_CHAT_ID
 
 
-def _api(method: str, **kwargs):
+def _api(method: str, *, http_timeout: float = 15, **kwargs):
     """Call Telegram Bot API."""
     if not BOT_TOKEN:
         _init()
@@ -43,7 +61,7 @@ def _api(method: str, **kwargs):
         return None
     url = f"https://api.telegram.org/bot{BOT_TOKEN}/{method}"
     try:
-        r = requests.post(url, json=kwargs, timeout=15)
+        r = _SESSION.post(url, json=kwargs, timeout=http_timeout)
         return r.json() if r.ok else None
     except Exception as exc:
         logger.warning("Telegram API error (%s): %s", method, exc)
@@ -64,10 +82,12 @@ def _handle_status(db):
     from sqlalchemy import func
     from app.models import AITool
 
-    total = db.query(func.count(AITool.id)).scalar()
-    posted = db.query(func.count(AITool.id)).filter(AITool.status == "POSTED").scalar()
-    failed = db.query(func.count(AITool.id)).filter(AITool.status == "FAILED").scalar()
-    ready = db.query(func.count(AITool.id)).filter(AITool.status == "READY").scalar()
+    # One GROUP BY round-trip instead of four COUNT queries
+    counts = dict(db.query(AITool.status, func.count(AITool.id)).group_by(AITool.status).all())
+    total = sum(counts.values())
+    posted = counts.get("POSTED", 0)
+    failed = counts.get("FAILED", 0)
+    ready = counts.get("READY", 0)
     rate = round(posted / max(total, 1) * 100, 1)
 
     msg = (
@@ -81,6 +101,17 @@ def _handle_status(db):
     _reply(msg)
 
 
+# (label, status getter) per platform for /recent, built once
+_RECENT_STATUS_GETTERS = tuple(
+    (lbl, attrgetter(f"{p}_status"))
+    for p, lbl in (
+        ("linkedin", "LI"), ("instagram", "IG"), ("facebook", "FB"), ("youtube", "YT"),
+        ("x", "X"), ("telegram_channel", "TG"), ("reddit", "RD"),
+    )
+)
+_RECENT_ICONS = {"SUCCESS": "✅", "FAILED": "❌"}  # anything else: skipped
+
+
 def _handle_recent(db):
     """Send the 5 most recently posted tools."""
     from app.models import AITool
@@ -98,11 +129,9 @@ def _handle_recent(db):
 
     lines = ["📋 <b>Recent Posts</b>\n"]
     for t in tools:
-        platforms = []
-        for p, lbl in (("linkedin","LI"),("instagram","IG"),("facebook","FB"),("youtube","YT"),("x","X"),("telegram_channel","TG"),("reddit","RD")):
-            st = getattr(t, f"{p}_status")
-            icon = "✅" if st == "SUCCESS" else ("❌" if st == "FAILED" else "⏭")
-            platforms.append(f"{icon}{lbl}")
+        platforms = [
+            f"{_RECENT_ICONS.get(get_status(t), '⏭')}{lbl}" for lbl, get_status in _RECENT_STATUS_GETTERS
+        ]
         posted_str = t.posted_at.strftime("%b %d, %H:%M") if t.posted_at else "—"
         lines.append(f"• <b>{t.tool_name}</b> — {posted_str}\n  {' '.join(platforms)}")
 
@@ -134,22 +163,37 @@ def _handle_queue(db):
     _reply("\n".join(lines))
 
 
+def _meta_token_info(token: str) -> dict | None:
+    """Return Meta's ``debug_token`` data for *token*, or None on API error.
+
+    Successful lookups are cached for ``_META_HEALTH_TTL_SECONDS`` per token,
+    so repeated /health commands don't each pay a Graph API round-trip.
+    """
+    global _meta_health_cache
+    cached = _meta_health_cache
+    if cached and cached[0] == token and time.monotonic() - cached[1] < _META_HEALTH_TTL_SECONDS:
+        return cached[2]
+
+    r = _SESSION.get(
+        "https://graph.facebook.com/v19.0/debug_token",
+        params={"input_token": token, "access_token": token},
+        timeout=10,
+    )
+    if not r.ok:
+        return None
+    data = r.json().get("data", {})
+    _meta_health_cache = (token, time.monotonic(), data)
+    return data
+
+
 def _handle_health():
     """Quick token health overview."""
     parts = ["🛡 <b>Token Health</b>\n"]
 
     if settings.META_ACCESS_TOKEN:
         try:
-            r = requests.get(
-                "https://graph.facebook.com/v19.0/debug_token",
-                params={
-                    "input_token": settings.META_ACCESS_TOKEN,
-                    "access_token": settings.META_ACCESS_TOKEN,
-                },
-                timeout=10,
-            )
-            if r.ok:
-                data = r.json().get("data", {})
+            data = _meta_token_info(settings.META_ACCESS_TOKEN)
+            if data is not None:
                 valid = data.get("is_valid", False)
                 expires = data.get("expires_at", 0)
                 if valid and expires and expires > 0:
@@ -218,25 +262,32 @@ def _handle_help():
     )
 
 
-def poll_telegram_updates():
-    """Called by the scheduler every 30s to check for new messages.
+def poll_telegram_updates(wait_seconds: int = 1) -> bool:
+    """Fetch and handle new messages, waiting up to *wait_seconds* for one.
 
     Only processes messages from the configured CHAT_ID for security.
+    Returns ``False`` if the Bot API could not be reached.
     """
     global _last_update_id
 
     if not BOT_TOKEN:
         _init()
     if not BOT_TOKEN or not CHAT_ID:
-        return
-
-    result = _api("getUpdates", offset=_last_update_id + 1, timeout=1, allowed_updates=["message"])
+        return False
+
+    result = _api(
+        "getUpdates",
+        http_timeout=wait_seconds + 10,
+        offset=_last_update_id + 1,
+        timeout=wait_seconds,
+        allowed_updates=["message"],
+    )
     if not result or not result.get("ok"):
-        return
+        return False
 
     updates = result.get("result", [])
     if not updates:
-        return
+        return True
 
     from app.database import SessionLocal
 
@@ -281,3 +332,31 @@ def poll_telegram_updates():
         logger.error("Telegram bot error: %s", exc)
     finally:
         db.close()
+    return True
+
+
+def _polling_loop() -> None:
+    """Long-poll getUpdates until :func:`stop_polling` is called."""
+    while not _poll_stop.is_set():
+        try:
+            ok = poll_telegram_updates(wait_seconds=_LONG_POLL_SECONDS)
+        except Exception as exc:
+            logger.error("Telegram bot polling error: %s", exc)
+            ok = False
+        if not ok:
+            _poll_stop.wait(_POLL_ERROR_BACKOFF_SECONDS)
+
+
+def start_polling() -> None:
+    """Start the long-polling thread (no-op if it is already running)."""
+    global _poll_thread
+    if _poll_thread and _poll_thread.is_alive():
+        return
+    _poll_stop.clear()
+    _poll_thread = threading.Thread(target=_polling_loop, name="telegram-bot-poll", daemon=True)
+    _poll_thread.start()
+
+
+def stop_polling() -> None:
+    """Ask the polling thread to exit after its current request."""
+    _poll_stop.set()
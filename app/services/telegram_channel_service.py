@@ -10,13 +10,20 @@ Required env vars:
 """
 
 import os
+import stat
+
 import requests
 
 from app.config import settings
+from app.utils.http import build_session
 from app.utils.logger import get_logger
+from app.utils.streaming import MultipartFileStream
 
 logger = get_logger(__name__)
 
+# Keep-alive session shared by every call in this module
+_SESSION = build_session()
+
 
 def post_to_telegram_channel(caption: str, video_path: str) -> bool:
     """Upload a video to the configured Telegram channel.
@@ -38,11 +45,17 @@ def post_to_telegram_channel(caption: str, video_path: str) -> bool:
         logger.error("Telegram channel post failed: TELEGRAM_CHANNEL_ID not set.")
         return False
 
-    if not os.path.isfile(video_path):
+    # One stat() gives both the existence check and the upload size
+    try:
+        st = os.stat(video_path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         logger.error("Telegram channel post failed: video file not found: %s", video_path)
         return False
 
-    file_size_mb = os.path.getsize(video_path) / (1024 * 1024)
+    file_size = st.st_size
+    file_size_mb = file_size / (1024 * 1024)
     if file_size_mb > 50:
         logger.warning("Video is %.1f MB — Telegram limit is 50 MB for bot uploads.", file_size_mb)
         # Try anyway; Telegram may reject it
@@ -54,15 +67,24 @@ def post_to_telegram_channel(caption: str, video_path: str) -> bool:
 
     try:
         with open(video_path, "rb") as vf:
-            resp = requests.post(
-                url,
-                data={
-                    "chat_id": channel_id,
+            # Streamed multipart body — files= would read the whole video into RAM
+            body = MultipartFileStream(
+                {
+                    "chat_id": str(channel_id),
                     "caption": trimmed_caption,
                     "parse_mode": "HTML",
                     "supports_streaming": "true",
                 },
-                files={"video": (os.path.basename(video_path), vf, "video/mp4")},
+                "video",
+                os.path.basename(video_path),
+                "video/mp4",
+                vf,
+                file_size,
+            )
+            resp = _SESSION.post(
+                url,
+                data=body,
+                headers=body.headers,
                 timeout=120,  # Large uploads may take time
             )
 
@@ -7,34 +7,53 @@ local file (e.g. uploaded via the frontend).
 """
 
 import os
+import re
 import shutil
 import tempfile
 from pathlib import Path
 
 import requests
 
+from app.utils.filenames import safe_filename
+from app.utils.http import build_session
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keep-alive session shared by every call in this module
+_SESSION = build_session()
+
 # Base directory for downloaded videos — use a cross-platform temp dir
 VIDEO_DIR = Path(tempfile.gettempdir()) / "execution_posting_videos"
 
+# 1 MB read/write blocks — far fewer syscalls and loop iterations than 8 KB
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+_HTTP_URL = re.compile(r"https?://", re.IGNORECASE)
+
 
 def _is_local_path(value: str) -> bool:
-    """Return True if *value* looks like a local filesystem path rather than a URL."""
-    # Absolute Windows path (e.g. E:\...) or UNC (\\server\...)
-    if len(value) >= 2 and value[1] == ":":
-        return True
-    if value.startswith("\\\\"):
-        return True
-    # Absolute Unix-style path
-    if value.startswith("/"):
-        return True
-    # Relative path that exists on disk (uploads/...)
-    if os.path.exists(value):
-        return True
-    return False
+    """Return True if *value* looks like a local filesystem path rather than a URL.
+
+    Anything that isn't an http(s) URL — absolute Windows/UNC/Unix paths and
+    relative ``uploads/...`` paths alike — is treated as local; a missing
+    file is reported by the caller.  No filesystem probe is needed.
+    """
+    return not _HTTP_URL.match(value.lstrip())
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    """Place *src* at *dest* without duplicating data when possible.
+
+    A hard link costs no I/O, and deleting *dest* later still leaves the
+    original upload intact.  Across filesystems it falls back to
+    ``shutil.copy2`` (which uses in-kernel ``sendfile`` on Linux).
+    """
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(str(src), str(dest))
 
 
 def download_video(video_url: str, tool_name: str) -> str:
@@ -59,7 +78,7 @@ def download_video(video_url: str, tool_name: str) -> str:
     VIDEO_DIR.mkdir(parents=True, exist_ok=True)
 
     # Sanitise the tool name for use as a filename
-    safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in tool_name)
+    safe_name = safe_filename(tool_name)
     dest = VIDEO_DIR / f"{safe_name}.mp4"
 
     # ── Local file path ───────────────────────────────────────────────────
@@ -70,7 +89,7 @@ def download_video(video_url: str, tool_name: str) -> str:
             raise RuntimeError(f"Local video file not found: {src}")
 
         logger.info("Copying local video for '%s': %s → %s", tool_name, src, dest)
-        shutil.copy2(str(src), str(dest))
+        _link_or_copy(src, dest)
 
         file_size = os.path.getsize(dest)
         logger.info("Video ready: %s (%s bytes)", dest, f"{file_size:,}")
@@ -79,12 +98,16 @@ def download_video(video_url: str, tool_name: str) -> str:
     # ── Remote URL ────────────────────────────────────────────────────────
     logger.info("Downloading video for '%s' from %s", tool_name, video_url)
 
+    # Download beside *dest* and rename over it: *dest* may still be a hard
+    # link to a user's upload, which opening it for writing would truncate
+    partial_path = dest.with_name(dest.name + ".part")
     try:
-        with requests.get(video_url, stream=True, timeout=120) as resp:
+        with _SESSION.get(video_url, stream=True, timeout=120) as resp:
             resp.raise_for_status()
-            with open(dest, "wb") as fh:
-                for chunk in resp.iter_content(chunk_size=8192):
+            with open(partial_path, "wb") as fh:
+                for chunk in resp.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
                     fh.write(chunk)
+        os.replace(partial_path, dest)
 
         file_size = os.path.getsize(dest)
         logger.info(
@@ -95,6 +118,8 @@ def download_video(video_url: str, tool_name: str) -> str:
     except requests.RequestException as exc:
         logger.error("Video download failed for '%s': %s", tool_name, exc)
         raise RuntimeError(f"Video download failed: {exc}") from exc
+    finally:
+        partial_path.unlink(missing_ok=True)
 
 
 def cleanup_video(video_path: str) -> None:
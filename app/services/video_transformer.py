@@ -22,22 +22,65 @@ Requires: ``ffmpeg`` (pre-installed on Render's Ubuntu image).
 Falls back gracefully to the original file if ffmpeg is unavailable.
 """
 
+import collections
+import contextlib
+import functools
+import hashlib
+import json
+import math
 import os
 import random
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import IO
 
-import requests
+from PIL import Image, ImageDraw, ImageFont
 
 from app.config import settings
+from app.utils.filenames import safe_filename
+from app.utils.http import build_session, post_json, response_json
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keep-alive session shared by every call in this module
+_SESSION = build_session()
+
 _TRANSFORM_DIR = Path(tempfile.gettempdir()) / "execution_posting_yt_transform"
 
+# Transformed outputs are kept for reuse until the directory exceeds this
+_TRANSFORM_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+# x264 (and small filter graphs) gain little past ~4 threads
+_ENCODE_THREADS = min(4, os.cpu_count() or 2)
+
+# Hardware H.264 encoders to try before libx264, in preference order
+_HW_ENCODERS = ("h264_nvenc", "h264_videotoolbox")
+
+# Consumer NVIDIA cards allow only a few concurrent NVENC sessions
+_HW_ENCODE_SEM = threading.BoundedSemaphore(2)
+
+# Caps concurrent ffmpeg processes so parallel posts don't oversubscribe the box
+_FFMPEG_SEM = threading.BoundedSemaphore(
+    settings.FFMPEG_MAX_CONCURRENCY or max(1, (os.cpu_count() or 2) // 4)
+)
+
+# Resolved once at import; absolute paths also spare each spawn a PATH walk
+_FFMPEG = shutil.which("ffmpeg")
+_FFPROBE = shutil.which("ffprobe") or "ffprobe"
+
+# Run ffmpeg at lower priority so it doesn't starve the web workers
+_NICE = shutil.which("nice")
+_NICE_PREFIX = [_NICE, "-n", "10"] if _NICE else []
+
+# Lines of ffmpeg stderr kept for error logs
+_STDERR_TAIL_LINES = 64
+
 # Local fallback music directory
 _MUSIC_DIR = Path(__file__).resolve().parent.parent.parent / "music"
 
@@ -45,28 +88,171 @@ _MUSIC_DIR = Path(__file__).resolve().parent.parent.parent / "music"
 _MUSIC_CACHE_DIR = Path(tempfile.gettempdir()) / "execution_posting_music_cache"
 _supabase_track_list: list[dict] | None = None  # cached file list
 
+# On-disk copy of the track list so fresh workers skip the list call
+_TRACK_LIST_FILE = _MUSIC_CACHE_DIR / "_tracklist.json"
+_TRACK_LIST_TTL_SECONDS = 3600
+
+# Generated ambient tracks are cached per this many seconds of duration
+_AMBIENT_BUCKET_SECS = 10
+
+# Ambient tracks pre-rendered at build time by scripts/gen_ambient.py
+AMBIENT_ASSET_DIR = _MUSIC_DIR / "ambient"
+AMBIENT_ASSET_LENGTHS = (30, 60, 90)
+
+# Read size for streamed track downloads (fewer write syscalls than 8 KB)
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def _ffmpeg_available() -> bool:
     """Check if ffmpeg is on the system PATH."""
-    return shutil.which("ffmpeg") is not None
+    return _FFMPEG is not None
+
+
+def _drain(stream: IO[bytes], ring: collections.deque) -> None:
+    """Read *stream* to EOF, keeping only the lines that fit in *ring*."""
+    for line in stream:
+        ring.append(line)
+    stream.close()
+
+
+def _run_ffmpeg(cmd: list[str], timeout: float) -> subprocess.CompletedProcess:
+    """Run an ffmpeg *cmd* under ``_FFMPEG_SEM`` at reduced CPU priority.
+
+    Only the tail of stderr is kept (as ``.stderr``), so a chatty encode
+    can't pile megabytes of output into memory.  Lines are buffered raw and
+    only that tail is decoded.
+    """
+    with _FFMPEG_SEM:
+        proc = subprocess.Popen(
+            _NICE_PREFIX + cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        ring: collections.deque = collections.deque(maxlen=_STDERR_TAIL_LINES)
+        reader = threading.Thread(target=_drain, args=(proc.stderr, ring), daemon=True)
+        reader.start()
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            reader.join()
+    stderr = b"".join(ring).decode("utf-8", "replace")
+    return subprocess.CompletedProcess(cmd, returncode, stderr=stderr)
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_hw_encoder() -> str | None:
+    """Return the first hardware H.264 encoder that actually works, if any.
+
+    ``ffmpeg -encoders`` lists encoders that were compiled in even when
+    there's no GPU, so each candidate is confirmed with a tiny test encode.
+    """
+    try:
+        listed = subprocess.run(
+            [_FFMPEG, "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=15,
+        ).stdout
+        for encoder in _HW_ENCODERS:
+            if encoder not in listed:
+                continue
+            probe = subprocess.run(
+                [
+                    _FFMPEG, "-hide_banner", "-f", "lavfi",
+                    "-i", "color=black:s=256x256:d=0.1",
+                    "-c:v", encoder, "-f", "null", "-",
+                ],
+                capture_output=True, timeout=15,
+            )
+            if probe.returncode == 0:
+                logger.info("Using hardware video encoder: %s", encoder)
+                return encoder
+    except Exception as exc:
+        logger.debug("Hardware encoder probe failed: %s", exc)
+    return None
+
+
+def _video_encoder_args(preset: str = "veryfast") -> list[str]:
+    """Return the ``-c:v`` arguments for the transform's video encode.
+
+    *preset* applies to the libx264 fallback only.
+    """
+    quality = str(settings.YOUTUBE_TRANSFORM_CRF)
+    encoder = _detect_hw_encoder()
+    if encoder == "h264_nvenc":
+        return [
+            "-c:v", encoder,
+            "-preset", "p4",
+            "-tune", "hq",
+            "-rc", "vbr",
+            "-cq", quality,
+            "-maxrate", "8M",
+            "-bufsize", "12M",
+            "-g", "120",
+        ]
+    if encoder == "h264_videotoolbox":
+        return ["-c:v", encoder, "-b:v", "8M"]
+    return [
+        "-c:v", "libx264",
+        "-preset", preset,
+        "-tune", "zerolatency",                # no B-frames / lookahead buffer
+        "-crf", quality,
+        "-threads", str(_ENCODE_THREADS),
+    ]
 
 
 # ── Music source selection ────────────────────────────────────────────────────
 
 _AUDIO_EXTENSIONS = {".mp3", ".wav", ".ogg", ".m4a", ".flac", ".aac"}
 
+# (music/ dir mtime_ns, track paths) from the last local scan
+_local_tracks_cache: tuple[int, list[str]] | None = None
+
+
+def _load_track_list_file() -> list[dict] | None:
+    """Return the on-disk track list if it is younger than the TTL."""
+    try:
+        if time.time() - _TRACK_LIST_FILE.stat().st_mtime > _TRACK_LIST_TTL_SECONDS:
+            return None
+        with open(_TRACK_LIST_FILE, encoding="utf-8") as fh:
+            tracks = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    return tracks if isinstance(tracks, list) else None
+
+
+def _save_track_list_file(tracks: list[dict]) -> None:
+    """Atomically write *tracks* to the on-disk track list."""
+    try:
+        _MUSIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = _TRACK_LIST_FILE.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(tracks, fh)
+        os.replace(tmp_path, _TRACK_LIST_FILE)
+    except OSError as exc:
+        logger.warning("Could not persist Supabase track list: %s", exc)
+
 
 def _list_supabase_tracks() -> list[dict]:
     """List audio files in the Supabase Storage music bucket.
 
     Returns a list of dicts with ``name`` keys.  Results are cached for the
-    lifetime of the process to avoid repeated API calls.
+    lifetime of the process, and on disk for ``_TRACK_LIST_TTL_SECONDS`` so
+    new workers don't repeat the API call.
     """
     global _supabase_track_list
 
     if _supabase_track_list is not None:
         return _supabase_track_list
 
+    tracks = _load_track_list_file()
+    if tracks is not None:
+        logger.debug("Supabase track list loaded from disk (%d track(s)).", len(tracks))
+        _supabase_track_list = tracks
+        return tracks
+
     url = settings.SUPABASE_URL
     key = settings.SUPABASE_ANON_KEY
     bucket = settings.SUPABASE_MUSIC_BUCKET
@@ -77,12 +263,14 @@ def _list_supabase_tracks() -> list[dict]:
 
     try:
         # Supabase Storage REST API: POST /storage/v1/object/list/{bucket}
-        resp = requests.post(
+        resp = post_json(
+            _SESSION,
             f"{url}/storage/v1/object/list/{bucket}",
-            json={"prefix": "", "limit": 100, "offset": 0},
+            {"prefix": "", "limit": 100, "offset": 0},
             headers={
                 "apikey": key,
                 "Authorization": f"Bearer {key}",
+                "Content-Type": "application/json",
             },
             timeout=15,
         )
@@ -91,7 +279,7 @@ def _list_supabase_tracks() -> list[dict]:
             _supabase_track_list = []
             return _supabase_track_list
 
-        files = resp.json()
+        files = response_json(resp)
         tracks = [
             f for f in files
             if isinstance(f, dict)
@@ -99,6 +287,7 @@ def _list_supabase_tracks() -> list[dict]:
             and Path(f["name"]).suffix.lower() in _AUDIO_EXTENSIONS
         ]
         _supabase_track_list = tracks
+        _save_track_list_file(tracks)
         logger.info("Supabase music bucket: found %d track(s).", len(tracks))
         return tracks
 
@@ -108,62 +297,159 @@ def _list_supabase_tracks() -> list[dict]:
         return _supabase_track_list
 
 
+def _content_range(header: str | None) -> tuple[int, int | None] | None:
+    """Parse ``bytes <start>-<end>/<total>`` into (start, total or None)."""
+    try:
+        unit, _, spec = header.partition(" ")
+        span, _, total = spec.partition("/")
+        if unit != "bytes":
+            return None
+        return int(span.split("-")[0]), None if total == "*" else int(total)
+    except (AttributeError, ValueError):
+        return None
+
+
 def _download_supabase_track(file_name: str) -> str | None:
     """Download a track from Supabase Storage to a local cache.
 
     Returns the cached file path, or None on failure.  Already-cached files
-    are returned immediately without re-downloading.
+    are returned immediately without re-downloading, and an interrupted
+    download is resumed with a ``Range`` request on the next call.
     """
     _MUSIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
     cached_path = _MUSIC_CACHE_DIR / file_name
 
     # Return cached version if it exists and has content
-    if cached_path.exists() and cached_path.stat().st_size > 0:
-        logger.debug("Music cache hit: %s", file_name)
-        return str(cached_path)
+    try:
+        if cached_path.stat().st_size > 0:
+            logger.debug("Music cache hit: %s", file_name)
+            return str(cached_path)
+    except FileNotFoundError:
+        pass
+
+    # Download beside the cache entry and rename into place once complete,
+    # so an interrupted download never looks like a cache hit.  The first
+    # response's ETag / Last-Modified is kept beside the partial file.
+    partial_path = cached_path.with_name(cached_path.name + ".part")
+    validator_path = cached_path.with_name(cached_path.name + ".part.etag")
+    try:
+        offset = partial_path.stat().st_size
+        validator = validator_path.read_text().strip()
+    except OSError:
+        offset, validator = 0, ""
+    # Resume only via If-Range: if the object was replaced (upsert), the
+    # server sends the whole new file (200) instead of splicing the suffix
+    range_headers = (
+        {"Range": f"bytes={offset}-", "If-Range": validator} if offset and validator else {}
+    )
 
     url = settings.SUPABASE_URL
     key = settings.SUPABASE_ANON_KEY
     bucket = settings.SUPABASE_MUSIC_BUCKET
 
+    def _discard_partial() -> None:
+        partial_path.unlink(missing_ok=True)
+        validator_path.unlink(missing_ok=True)
+
     try:
         # Public download URL for Supabase Storage
         download_url = f"{url}/storage/v1/object/public/{bucket}/{file_name}"
-        resp = requests.get(download_url, timeout=60, stream=True)
+        resp = _SESSION.get(download_url, headers=range_headers, timeout=60, stream=True)
 
         if not resp.ok:
             # Try authenticated download if public access is off
+            resp.close()  # return the streamed connection to the pool
             download_url = f"{url}/storage/v1/object/{bucket}/{file_name}"
-            resp = requests.get(
+            resp = _SESSION.get(
                 download_url,
                 headers={
                     "apikey": key,
                     "Authorization": f"Bearer {key}",
+                    **range_headers,
                 },
                 timeout=60,
                 stream=True,
             )
 
-        if not resp.ok:
-            logger.warning("Supabase music download failed (%d): %s", resp.status_code, file_name)
+        with resp:
+            if not resp.ok:
+                logger.warning(
+                    "Supabase music download failed (%d): %s", resp.status_code, file_name,
+                )
+                if resp.status_code == 416:
+                    # Stale partial no longer matches the remote file
+                    _discard_partial()
+                return None
+
+            # 206 = server honoured the Range; 200 = full body, start over
+            resumed = resp.status_code == 206
+            total = None
+            if resumed:
+                content_range = _content_range(resp.headers.get("Content-Range"))
+                if content_range is None or content_range[0] != offset:
+                    logger.warning(
+                        "Supabase music resume mismatch for %s (%s) — discarding partial",
+                        file_name,
+                        resp.headers.get("Content-Range"),
+                    )
+                    _discard_partial()
+                    return None
+                total = content_range[1]
+            else:
+                new_validator = resp.headers.get("ETag") or resp.headers.get("Last-Modified")
+                if new_validator:
+                    validator_path.write_text(new_validator)
+                else:
+                    validator_path.unlink(missing_ok=True)
+
+            size = offset if resumed else 0
+            with open(partial_path, "ab" if resumed else "wb") as fh:
+                for chunk in resp.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    size += fh.write(chunk)
+
+        if total is not None and size != total:
+            logger.warning(
+                "Supabase music download incomplete for %s (%s of %s bytes)",
+                file_name, f"{size:,}", f"{total:,}",
+            )
             return None
+        os.replace(partial_path, cached_path)
+        validator_path.unlink(missing_ok=True)
 
-        with open(cached_path, "wb") as fh:
-            for chunk in resp.iter_content(chunk_size=8192):
-                fh.write(chunk)
-
-        logger.info("Downloaded music from Supabase: %s (%s bytes)",
-                     file_name, f"{cached_path.stat().st_size:,}")
+        logger.info("Downloaded music from Supabase: %s (%s bytes%s)", file_name, f"{size:,}",
+                     f", resumed at {offset:,}" if resumed else "")
         return str(cached_path)
 
     except Exception as exc:
+        # Keep the partial file so the next attempt can resume it
         logger.warning("Supabase music download error for %s: %s", file_name, exc)
-        # Cleanup partial download
-        if cached_path.exists():
-            cached_path.unlink(missing_ok=True)
         return None
 
 
+def _list_local_tracks() -> list[str]:
+    """Return paths of audio files in the local ``music/`` folder.
+
+    The listing comes from one ``os.scandir`` and is reused until the
+    folder's mtime changes (i.e. a file is added, removed or renamed).
+    """
+    global _local_tracks_cache
+
+    try:
+        mtime = os.stat(_MUSIC_DIR).st_mtime_ns
+    except OSError:
+        return []
+    if _local_tracks_cache is not None and _local_tracks_cache[0] == mtime:
+        return _local_tracks_cache[1]
+
+    with os.scandir(_MUSIC_DIR) as it:
+        tracks = [
+            entry.path for entry in it
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in _AUDIO_EXTENSIONS
+        ]
+    _local_tracks_cache = (mtime, tracks)
+    return tracks
+
+
 def _get_music_track() -> tuple[str | None, str]:
     """Find a royalty-free music track.  Priority order:
 
@@ -185,22 +471,32 @@ def _get_music_track() -> tuple[str | None, str]:
         logger.warning("Supabase track download failed, trying local fallback.")
 
     # ── 2. Local music/ folder ────────────────────────────────────────────
-    if _MUSIC_DIR.exists():
-        local_tracks = [
-            f for f in _MUSIC_DIR.iterdir()
-            if f.is_file() and f.suffix.lower() in _AUDIO_EXTENSIONS
-        ]
-        if local_tracks:
-            chosen_local = random.choice(local_tracks)
-            logger.info("Music: using local track '%s' from %d available.",
-                         chosen_local.name, len(local_tracks))
-            return str(chosen_local), "local"
+    local_tracks = _list_local_tracks()
+    if local_tracks:
+        chosen_local = random.choice(local_tracks)
+        logger.info("Music: using local track '%s' from %d available.",
+                     os.path.basename(chosen_local), len(local_tracks))
+        return chosen_local, "local"
 
     # ── 3. No music available ─────────────────────────────────────────────
     return None, "none"
 
 
-def _generate_ambient_track(duration_secs: float) -> str | None:
+def _prebuilt_ambient_track(duration_secs: float) -> str | None:
+    """Return the shortest pre-rendered ambient track covering *duration_secs*."""
+    for length in AMBIENT_ASSET_LENGTHS:
+        if length < duration_secs:
+            continue
+        path = AMBIENT_ASSET_DIR / f"ambient_{length}.wav"
+        try:
+            if path.stat().st_size > 1024:
+                return str(path)
+        except FileNotFoundError:
+            pass
+    return None
+
+
+def _generate_ambient_track(duration_secs: float, out_dir: Path = _MUSIC_CACHE_DIR) -> str | None:
     """Generate a lo-fi ambient background track using FFmpeg's audio synthesis.
 
     Creates a layered ambient soundscape:
@@ -211,13 +507,29 @@ def _generate_ambient_track(duration_secs: float) -> str | None:
     The result sounds like a chill lo-fi background track — pleasant,
     non-distracting, and 100% copyright-free (generated, not sampled).
 
+    Tracks are cached in *out_dir* per ``_AMBIENT_BUCKET_SECS`` bucket of
+    *duration_secs* (rounded up); the transform trims the music to the video
+    length anyway.
+
     Returns path to the generated WAV file, or None on failure.
     """
+    bucket = math.ceil(duration_secs / _AMBIENT_BUCKET_SECS) * _AMBIENT_BUCKET_SECS
+    out_path = out_dir / f"ambient_{bucket}.wav"
+    try:
+        if out_path.stat().st_size > 1024:
+            logger.debug("Ambient track cache hit: %s", out_path.name)
+            return str(out_path)
+    except FileNotFoundError:
+        pass
+
     if not _ffmpeg_available():
         return None
 
-    _TRANSFORM_DIR.mkdir(parents=True, exist_ok=True)
-    out_path = _TRANSFORM_DIR / "ambient_bg.wav"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    partial_path = out_path.with_name(out_path.name + ".part")
+    duration_secs = bucket  # synthesise the whole bucket
+    # Seed from the bucket so a regenerated track matches the cached one
+    rng = random.Random(bucket)
 
     # Build a multi-layered ambient track using FFmpeg's lavfi filters
     # Layer 1: Warm pink noise pad with bandpass (the "bed")
@@ -226,7 +538,7 @@ def _generate_ambient_track(duration_secs: float) -> str | None:
     # All mixed together and slightly compressed
     filter_complex = (
         # Layer 1: Warm pad — pink noise through a bandpass filter
-        f"anoisesrc=color=pink:duration={duration_secs}:seed={random.randint(1,99999)},"
+        f"anoisesrc=color=pink:duration={duration_secs}:seed={rng.randint(1, 99999)},"
         "highpass=f=200,lowpass=f=800,"
         "volume=0.25,"
         "tremolo=f=0.3:d=0.4"                 # gentle pulsing
@@ -239,7 +551,7 @@ def _generate_ambient_track(duration_secs: float) -> str | None:
         "volume=0.10"
         "[bass2];"
         # Layer 3: High shimmer — filtered white noise
-        f"anoisesrc=color=white:duration={duration_secs}:seed={random.randint(1,99999)},"
+        f"anoisesrc=color=white:duration={duration_secs}:seed={rng.randint(1, 99999)},"
         "highpass=f=4000,lowpass=f=8000,"
         "volume=0.06,"
         "tremolo=f=0.5:d=0.3"                 # faster shimmer
@@ -252,52 +564,182 @@ def _generate_ambient_track(duration_secs: float) -> str | None:
     )
 
     cmd = [
-        "ffmpeg", "-y",
+        _FFMPEG, "-y", "-hide_banner", "-loglevel", "error",
+        # The four source layers are independent until amix
+        "-filter_complex_threads", str(_ENCODE_THREADS),
         "-f", "lavfi",
         "-i", f"anullsrc=r=44100:cl=stereo",    # dummy input for complex filter
         "-filter_complex", filter_complex,
         "-t", str(duration_secs),
         "-c:a", "pcm_s16le",
-        str(out_path),
+        "-f", "wav",
+        str(partial_path),
     ]
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        result = _run_ffmpeg(cmd, timeout=60)
         if result.returncode != 0:
             logger.warning("Ambient track generation failed: %s", result.stderr[-300:])
             return None
 
-        if out_path.exists() and out_path.stat().st_size > 0:
+        if partial_path.exists() and partial_path.stat().st_size > 0:
+            os.replace(partial_path, out_path)
             logger.info("Generated ambient track: %s (%.1fs)", out_path.name, duration_secs)
             return str(out_path)
 
     except Exception as exc:
         logger.warning("Ambient generation error: %s", exc)
+    finally:
+        partial_path.unlink(missing_ok=True)
 
     return None
 
 
-def _get_video_duration(video_path: str) -> float:
-    """Get video duration in seconds using ffprobe."""
+def _get_video_duration(video_path: str) -> float | None:
+    """Get video duration in seconds using ffprobe (None if it can't be read).
+
+    Results are cached per (path, size, mtime) so retries and repeat
+    transforms of the same upload skip the probe.
+    """
     try:
-        result = subprocess.run(
-            [
-                "ffprobe", "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                video_path,
-            ],
-            capture_output=True, text=True, timeout=15,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return float(result.stdout.strip())
+        st = os.stat(video_path)
+        return _probe_duration_cached(video_path, st.st_size, st.st_mtime_ns)
     except Exception:
-        pass
-    return 60.0  # default assumption for Shorts
+        # Failures raise out of the cached probe, so they are never cached
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def _probe_duration_cached(video_path: str, _size: int, _mtime_ns: int) -> float:
+    """Run ffprobe for *video_path*; the size/mtime args only key the cache."""
+    result = subprocess.run(
+        [
+            _FFPROBE, "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            video_path,
+        ],
+        capture_output=True, text=True, timeout=15,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe exited with {result.returncode}")
+    return float(result.stdout.strip())
 
 
 # ── Main transformer ─────────────────────────────────────────────────────────
 
+_DEFAULT_OVERLAY = "AI Tool Review | execution.ai"
+
+# Overlay bar geometry (shared by the PNG and drawtext variants): text top
+# sits 45px above the bottom edge, inside an 8px box border
+_OVERLAY_FONT_SIZE = 22
+_OVERLAY_BOX_BORDER = 8
+_OVERLAY_BOTTOM_OFFSET = 45 + _OVERLAY_BOX_BORDER
+
+
+def _overlay_png(text: str) -> str | None:
+    """Render the overlay bar for *text* to a transparent PNG, once.
+
+    Blending a pre-rendered image is much cheaper per frame than having
+    ``drawtext`` rasterise the glyphs on every frame.  Returns None if the
+    image can't be rendered (caller falls back to ``drawtext``).
+    """
+    digest = hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+    path = _TRANSFORM_DIR / f"overlay_{digest}.png"
+    if path.exists():
+        return str(path)
+
+    try:
+        font = ImageFont.load_default(size=_OVERLAY_FONT_SIZE)
+        left, top, right, bottom = font.getbbox(text)
+        pad = _OVERLAY_BOX_BORDER
+        image = Image.new(
+            "RGBA", (right - left + 2 * pad, bottom - top + 2 * pad), (0, 0, 0, 153),
+        )
+        ImageDraw.Draw(image).text((pad - left, pad - top), text, font=font, fill="white")
+        partial_path = path.with_name(path.name + ".part")
+        image.save(partial_path, format="PNG")
+        os.replace(partial_path, path)
+    except (OSError, ValueError) as exc:
+        logger.warning("Could not pre-render overlay (%s) — using drawtext.", exc)
+        return None
+    return str(path)
+
+
+# drawtext option escaping, applied in a single pass
+_DRAWTEXT_ESCAPES = str.maketrans({":": r"\:", "'": r"'\''"})
+
+
+@functools.lru_cache(maxsize=32)
+def _drawtext_filter(text: str) -> str:
+    """Return the escaped ``drawtext`` filter for the overlay bar."""
+    escaped = text.translate(_DRAWTEXT_ESCAPES)
+    return (
+        f"drawtext=text='{escaped}'"
+        f":fontsize={_OVERLAY_FONT_SIZE}"
+        ":fontcolor=white"
+        ":x=(w-text_w)/2"
+        ":y=h-45"
+        ":box=1"
+        ":boxcolor=black@0.6"
+        f":boxborderw={_OVERLAY_BOX_BORDER}"
+    )
+
+
+def _transform_key(
+    video_path: str,
+    tool_name: str,
+    add_overlay: bool,
+    speed_factor: float,
+    overlay_text: str | None,
+    music_volume: float,
+    preset: str,
+    source_id: str | None = None,
+) -> str:
+    """Return a short hash identifying a transform of *video_path* with these params.
+
+    With a *source_id* (e.g. the remote URL) the source is identified by it
+    and the file size, so a fresh re-download of the same URL (new mtime)
+    still maps to the same key.
+    """
+    try:
+        st = os.stat(video_path)
+        if source_id:
+            source = f"{source_id}:{st.st_size}"
+        else:
+            source = f"{st.st_size}:{st.st_mtime_ns}"
+    except OSError:
+        source = source_id or video_path
+    raw = (
+        f"{source}:{tool_name}:{add_overlay}:{speed_factor}:{overlay_text}:"
+        f"{music_volume}:{preset}:{settings.YOUTUBE_TRANSFORM_CRF}"
+    )
+    return hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
+
+
+def _evict_transform_cache() -> None:
+    """Delete least-recently-used outputs until the cache fits its size budget."""
+    try:
+        entries = []
+        for entry in os.scandir(_TRANSFORM_DIR):
+            if entry.name.startswith("yt_") and entry.is_file():
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+    except OSError:
+        return
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= _TRANSFORM_CACHE_MAX_BYTES:
+            break
+        try:
+            os.unlink(path)
+            total -= size
+            logger.debug("Evicted cached transform: %s", os.path.basename(path))
+        except OSError:
+            pass
+
+
 def transform_for_youtube(
     video_path: str,
     tool_name: str,
@@ -306,6 +748,8 @@ def transform_for_youtube(
     speed_factor: float = 1.05,
     overlay_text: str | None = None,
     music_volume: float = 0.35,
+    preset: str = "veryfast",
+    source_id: str | None = None,
 ) -> str:
     """Create a YouTube-safe version of the video with background music.
 
@@ -321,6 +765,12 @@ def transform_for_youtube(
         speed_factor: Playback speed multiplier (1.05 = barely perceptible).
         overlay_text: Custom overlay string.
         music_volume: Volume of background music (0.0–1.0, default 0.35).
+        preset: libx264 speed/size preset (ignored for hardware encoders).
+        source_id: Stable identity of the source (e.g. its URL) used for the
+            output cache key instead of the file's mtime.
+
+    With ``speed_factor=1.0`` and ``add_overlay=False`` the video stream is
+    copied as-is (fast, but no visual fingerprint shift).
 
     Returns:
         Path to the transformed video file.  Falls back to *original*
@@ -334,19 +784,41 @@ def transform_for_youtube(
         return video_path
 
     _TRANSFORM_DIR.mkdir(parents=True, exist_ok=True)
-    safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in tool_name)
-    out_path = _TRANSFORM_DIR / f"yt_{safe_name}.mp4"
+    safe_name = safe_filename(tool_name)
+    key = _transform_key(
+        video_path, tool_name, add_overlay, speed_factor, overlay_text, music_volume, preset,
+        source_id,
+    )
+    out_path = _TRANSFORM_DIR / f"yt_{safe_name}_{key}.mp4"
 
-    # ── Get video duration ────────────────────────────────────────────────
-    duration = _get_video_duration(video_path)
+    # Same input + params already transformed (e.g. an earlier failed upload)
+    try:
+        if out_path.stat().st_size > 0:
+            os.utime(out_path)  # mark as recently used for eviction
+            logger.info("YouTube transform cache hit: %s", out_path.name)
+            return str(out_path)
+    except FileNotFoundError:
+        pass
+    _evict_transform_cache()
+
+    # Encode beside the final name so an interrupted run is never a cache hit
+    partial_path = out_path.with_name(out_path.name + ".part")
+
+    # ── Probe duration while fetching background music ────────────────────
+    # The two are independent: overlap the ffprobe run with the (possibly
+    # network-bound) Supabase list/download
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        music_future = pool.submit(_get_music_track)
+        probed_duration = _get_video_duration(video_path)
+        music_path, music_source = music_future.result()
+    duration = probed_duration or 60.0  # default assumption for Shorts
     adjusted_duration = duration / speed_factor  # after speed-up
 
-    # ── Find background music ─────────────────────────────────────────────
-    music_path, music_source = _get_music_track()
-
     if not music_path:
-        # Last resort: generate ambient beat
-        music_path = _generate_ambient_track(adjusted_duration)
+        # Last resort: ambient beat (pre-rendered if available, else synthesised)
+        music_path = _prebuilt_ambient_track(adjusted_duration) or _generate_ambient_track(
+            adjusted_duration,
+        )
         if music_path:
             music_source = "generated"
 
@@ -358,66 +830,86 @@ def transform_for_youtube(
         logger.warning("No music available — video will have no audio.")
 
     # ── Build ffmpeg command ──────────────────────────────────────────────
-    overlay = overlay_text or "AI Tool Review | execution.ai"
-    overlay_escaped = overlay.replace(":", r"\:").replace("'", r"'\''")
-
     # Video filters
     vfilters: list[str] = []
     if speed_factor and speed_factor != 1.0:
         pts_factor = round(1.0 / speed_factor, 6)
         vfilters.append(f"setpts={pts_factor}*PTS")
+    overlay_png = None
     if add_overlay:
-        vfilters.append(
-            f"drawtext=text='{overlay_escaped}'"
-            ":fontsize=22"
-            ":fontcolor=white"
-            ":x=(w-text_w)/2"
-            ":y=h-45"
-            ":box=1"
-            ":boxcolor=black@0.6"
-            ":boxborderw=8"
-        )
-
-    vfilter_str = ",".join(vfilters) if vfilters else None
-
-    # Assemble command
-    cmd: list[str] = ["ffmpeg", "-y", "-i", video_path]
-
+        text = overlay_text or _DEFAULT_OVERLAY
+        overlay_png = _overlay_png(text)
+        if overlay_png is None:
+            vfilters.append(_drawtext_filter(text))
+
+    # With no video filters the frames are unchanged, so stream-copy them
+    # and only encode the audio
+    filter_video = bool(vfilters) or overlay_png is not None
+    encoder_args = _video_encoder_args(preset) if filter_video else ["-c:v", "copy"]
+    if filter_video:
+        # Convert once, up front: drawtext/overlay and the encoder all work
+        # in yuv420p, so no auto-inserted scale runs later in the graph (and
+        # 4:4:4 / 10-bit sources still come out as widely playable 8-bit 4:2:0)
+        vfilters.insert(0, "format=yuv420p")
+
+    # Assemble command: 0 = video, then music and the overlay image if used
+    cmd: list[str] = [_FFMPEG, "-y", "-hide_banner", "-loglevel", "error"]
+    if encoder_args[1] == "h264_nvenc":
+        # Decode on the GPU too; frames come back to system memory so the
+        # CPU-side filters (setpts, overlay) work unchanged
+        cmd += ["-hwaccel", "cuda"]
+    cmd += ["-i", video_path]
     if has_music:
-        # Add music as second input
-        cmd += ["-i", music_path]
-
-        # Build the command: strip original audio, use music instead
-        if vfilter_str:
-            cmd += ["-vf", vfilter_str]
+        # Looped at demux time so a short track covers the whole video
+        # without buffering decoded audio
+        cmd += ["-stream_loop", "-1", "-i", music_path]
+    if overlay_png:
+        cmd += ["-i", overlay_png]
+
+    # Video and audio chains share one filter graph
+    graph: list[str] = []
+    video_map = "0:v"
+    if filter_video:
+        chain_out = "[base]" if overlay_png else "[v]"
+        graph.append(f"[0:v]{','.join(vfilters)}{chain_out}")
+        if overlay_png:
+            png_input = 2 if has_music else 1
+            graph.append(f"[base][{png_input}:v]overlay=(W-w)/2:H-{_OVERLAY_BOTTOM_OFFSET}[v]")
+        video_map = "[v]"
 
-        # Audio: loop music if shorter than video, trim to video length,
-        # set volume, and fade out at the end
+    if has_music:
+        # Audio: strip the original, use music at the given volume with
+        # fades; the output length limit below cuts the looped music
         fade_start = max(0, adjusted_duration - 1.5)
-        audio_filter = (
-            f"[1:a]aloop=loop=-1:size=2e+09,atrim=0:{adjusted_duration},"
-            f"volume={music_volume},"
+        graph.append(
+            f"[1:a]volume={music_volume},"
             f"afade=t=in:st=0:d=1.5,"
             f"afade=t=out:st={fade_start}:d=1.5[bgm]"
         )
-        cmd += ["-filter_complex", audio_filter, "-map", "0:v", "-map", "[bgm]"]
-    else:
-        # No music available — strip audio entirely
-        if vfilter_str:
-            cmd += ["-vf", vfilter_str]
-        cmd.append("-an")
+
+    if graph:
+        cmd += ["-filter_complex", ";".join(graph)]
+    cmd += ["-map", video_map]
+    # No music available — strip audio entirely
+    cmd += ["-map", "[bgm]"] if has_music else ["-an"]
 
     # Output encoding
+    cmd += encoder_args
+    # Cut at the known video length; only fall back to -shortest (which
+    # has to watch both streams for EOF) when ffprobe couldn't measure it
+    if probed_duration:
+        cmd += ["-t", f"{adjusted_duration:.3f}"]
+    else:
+        cmd.append("-shortest")
     cmd += [
-        "-c:v", "libx264",
-        "-preset", "fast",
-        "-crf", "23",
         "-c:a", "aac",
         "-b:a", "128k",
-        "-movflags", "+faststart",
+        # No +faststart: the file is only ever uploaded whole to YouTube, so
+        # moving the moov atom to the front would just cost a second full
+        # read+write pass over the output
         "-max_muxing_queue_size", "1024",
-        "-shortest",                           # trim to shortest stream
-        str(out_path),
+        "-f", "mp4",
+        str(partial_path),
     ]
 
     logger.info(
@@ -430,17 +922,15 @@ def transform_for_youtube(
     logger.debug("FFmpeg cmd: %s", " ".join(cmd))
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,
-        )
+        hw_slot = _HW_ENCODE_SEM if encoder_args[1] in _HW_ENCODERS else contextlib.nullcontext()
+        with hw_slot:
+            result = _run_ffmpeg(cmd, timeout=300)
         if result.returncode != 0:
             logger.error("FFmpeg failed (rc=%d): %s", result.returncode, result.stderr[-500:])
             return video_path
 
-        if out_path.exists() and out_path.stat().st_size > 0:
+        if partial_path.exists() and partial_path.stat().st_size > 0:
+            os.replace(partial_path, out_path)
             logger.info(
                 "YouTube transform OK: %s → %s (%s bytes, music=%s)",
                 video_path,
@@ -459,6 +949,8 @@ def transform_for_youtube(
     except Exception as exc:
         logger.error("YouTube transform error: %s — using original video.", exc)
         return video_path
+    finally:
+        partial_path.unlink(missing_ok=True)
 
 
 def cleanup_transformed(video_path: str) -> None:
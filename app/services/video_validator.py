@@ -10,12 +10,18 @@ Returns structured warnings about:
 All checks are *warnings* — the user can still proceed ("force upload").
 """
 
+import functools
 import hashlib
+import mmap
 import os
+import stat
 import subprocess
-import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+import av
+import orjson
+
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -75,33 +81,107 @@ PLATFORM_LIMITS = {
 
 
 def _probe_video(file_path: str) -> Optional[dict]:
-    """Use ffprobe to extract video metadata.
+    """Extract video metadata (PyAV, with ffprobe as a fallback).
 
     Returns dict with: duration, width, height, size_mb, codec, format.
-    Returns None if ffprobe fails or the file doesn't exist.
+    Returns None if probing fails or the file doesn't exist.  Results are
+    cached per (path, mtime, size), so re-validating an unchanged upload
+    doesn't probe it again.
     """
-    if not os.path.isfile(file_path):
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
         return None
 
+    probe = _probe_video_cached(file_path, st.st_mtime_ns, st.st_size)
+    return dict(probe) if probe else None
+
+
+# Cap how much stream data libavformat reads to identify codecs (defaults:
+# 5 MB / 5 s).  MP4 headers parse well within 1 MB; the mov demuxer still
+# seeks to a trailing moov atom regardless.
+_PROBE_LIMITS = {"probesize": "1000000", "analyzeduration": "1000000"}
+
+
+def _metadata(
+    duration: float,
+    size_bytes: int,
+    width: int,
+    height: int,
+    codec: str,
+    format_name: str,
+) -> dict:
+    """Build the metadata dict returned by ``_probe_video``."""
+    return {
+        "duration_sec": round(duration, 1),
+        "size_mb": round(size_bytes / (1024 * 1024), 2),
+        "size_bytes": size_bytes,
+        "width": width,
+        "height": height,
+        "codec": codec,
+        "format": format_name,
+        "aspect_ratio": f"{width}:{height}" if width and height else "unknown",
+        "is_vertical": height > width if width and height else None,
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def _probe_video_cached(file_path: str, _mtime_ns: int, size: int) -> Optional[dict]:
+    """Probe *file_path*; the mtime/size args key the cache.
+
+    Reads the container headers in-process with PyAV (no fork/exec, no JSON),
+    falling back to the ffprobe CLI if PyAV can't open the file.
+    """
+    try:
+        return _probe_with_av(file_path, size)
+    except Exception as exc:
+        logger.debug("PyAV probe failed for %s (%s) — trying ffprobe", file_path, exc)
+    return _probe_with_ffprobe(file_path)
+
+
+def _probe_with_av(file_path: str, size: int) -> dict:
+    """Extract metadata via libavformat bindings (same parse as ffprobe)."""
+    with av.open(file_path, options=_PROBE_LIMITS) as container:
+        video_stream = container.streams.video[0] if container.streams.video else None
+        duration = container.duration / av.time_base if container.duration else 0.0
+        return _metadata(
+            duration,
+            size,
+            video_stream.width if video_stream else 0,
+            video_stream.height if video_stream else 0,
+            video_stream.codec_context.name if video_stream else "unknown",
+            container.format.name,
+        )
+
+
+def _probe_with_ffprobe(file_path: str) -> Optional[dict]:
+    """Run the ffprobe CLI and parse its JSON output."""
     try:
         result = subprocess.run(
             [
                 "ffprobe",
                 "-v", "quiet",
+                "-probesize", _PROBE_LIMITS["probesize"],
+                "-analyzeduration", _PROBE_LIMITS["analyzeduration"],
                 "-print_format", "json",
                 "-show_format",
                 "-show_streams",
                 file_path,
             ],
             capture_output=True,
-            text=True,
             timeout=30,
         )
         if result.returncode != 0:
-            logger.warning("ffprobe failed for %s: %s", file_path, result.stderr)
+            logger.warning(
+                "ffprobe failed for %s: %s",
+                file_path,
+                result.stderr.decode(errors="replace"),
+            )
             return None
 
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout)  # parses bytes directly
         fmt = data.get("format", {})
         video_stream = None
         for stream in data.get("streams", []):
@@ -109,25 +189,14 @@ def _probe_video(file_path: str) -> Optional[dict]:
                 video_stream = stream
                 break
 
-        duration = float(fmt.get("duration", 0))
-        size_bytes = int(fmt.get("size", 0))
-        size_mb = round(size_bytes / (1024 * 1024), 2)
-        width = int(video_stream.get("width", 0)) if video_stream else 0
-        height = int(video_stream.get("height", 0)) if video_stream else 0
-        codec = video_stream.get("codec_name", "unknown") if video_stream else "unknown"
-        format_name = fmt.get("format_name", "unknown")
-
-        return {
-            "duration_sec": round(duration, 1),
-            "size_mb": size_mb,
-            "size_bytes": size_bytes,
-            "width": width,
-            "height": height,
-            "codec": codec,
-            "format": format_name,
-            "aspect_ratio": f"{width}:{height}" if width and height else "unknown",
-            "is_vertical": height > width if width and height else None,
-        }
+        return _metadata(
+            float(fmt.get("duration", 0)),
+            int(fmt.get("size", 0)),
+            int(video_stream.get("width", 0)) if video_stream else 0,
+            int(video_stream.get("height", 0)) if video_stream else 0,
+            video_stream.get("codec_name", "unknown") if video_stream else "unknown",
+            fmt.get("format_name", "unknown"),
+        )
     except FileNotFoundError:
         logger.warning("ffprobe not found — video validation disabled")
         return None
@@ -139,7 +208,8 @@ def _probe_video(file_path: str) -> Optional[dict]:
 def compute_video_hash(file_path: str) -> Optional[str]:
     """Compute a SHA-256 hash of the video file for duplicate detection.
 
-    Uses a chunked read to handle large files efficiently. Only hashes
+    The file is memory-mapped and hashed in OpenSSL's C loop (SHA-NI where
+    available) without copying it into Python bytes. Only hashes
     the first 10MB and last 10MB for speed on very large files.
     """
     if not os.path.isfile(file_path):
@@ -147,37 +217,27 @@ def compute_video_hash(file_path: str) -> Optional[str]:
 
     try:
         file_size = os.path.getsize(file_path)
-        hasher = hashlib.sha256()
-        chunk_size = 1024 * 1024  # 1MB chunks
         boundary = 10 * 1024 * 1024  # 10MB
 
-        with open(file_path, "rb") as f:
-            if file_size <= boundary * 2:
-                # Small file: hash everything
-                while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
-                        break
-                    hasher.update(chunk)
-            else:
-                # Large file: hash first 10MB + last 10MB + file size
-                read = 0
-                while read < boundary:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
-                        break
-                    hasher.update(chunk)
-                    read += len(chunk)
-
-                f.seek(-boundary, 2)  # seek from end
-                while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
-                        break
-                    hasher.update(chunk)
-
-                # Include file size to differentiate similar-start/end files
-                hasher.update(str(file_size).encode())
+        if file_size == 0:
+            return hashlib.sha256().hexdigest()  # mmap can't map an empty file
+
+        # Hash straight from the page cache via mmap (no copy into bytes)
+        with open(file_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mm) as view:
+                if file_size <= boundary * 2:
+                    # Small file: hash everything
+                    hasher = hashlib.sha256(view)
+                else:
+                    # Large file: hash first 10MB + last 10MB + file size
+                    hasher = hashlib.sha256(view[:boundary])
+                    hasher.update(view[-boundary:])
+
+                    # Include file size to differentiate similar-start/end files
+                    hasher.update(str(file_size).encode())
 
         return hasher.hexdigest()
     except Exception as exc:
@@ -190,6 +250,7 @@ def validate_video(
     video_url: Optional[str] = None,
     tool_name: Optional[str] = None,
     existing_tools: Optional[list] = None,
+    metadata: Optional[dict] = None,
 ) -> dict:
     """Run all validation checks and return structured results.
 
@@ -199,6 +260,8 @@ def validate_video(
         tool_name: Name of the tool (for duplicate name check).
         existing_tools: List of dicts with keys: tool_name, video_url, video_hash,
                         created_at, status — for duplicate detection.
+        metadata: Probe result the caller already has (same shape as
+                  ``_probe_video``); skips probing the file.
 
     Returns:
         {
@@ -216,7 +279,12 @@ def validate_video(
 
     # ── 1. Probe video metadata (only for local files) ──────────────────
     if file_path and os.path.isfile(file_path):
-        probe = _probe_video(file_path)
+        # Probe and hash are independent; overlap the ffprobe run with the
+        # disk read
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            hash_future = pool.submit(compute_video_hash, file_path)
+            probe = metadata if metadata is not None else _probe_video(file_path)
+            video_hash = hash_future.result()
         if probe:
             info = probe
             duration = probe["duration_sec"]
@@ -294,9 +362,6 @@ def validate_video(
                     ),
                 })
 
-        # Compute hash for duplicate detection
-        video_hash = compute_video_hash(file_path)
-
     # ── 2. Check file extension ──────────────────────────────────────────
     check_path = file_path or video_url or ""
     if check_path and not check_path.lower().endswith((".mp4", ".mov", ".avi", ".mkv", ".webm")):
@@ -309,32 +374,26 @@ def validate_video(
         })
 
     # ── 3. Duplicate detection ───────────────────────────────────────────
-    if existing_tools:
+    # Normalise the candidate once, not once per existing tool
+    name_key = tool_name.strip().lower() if tool_name else None
+    url_key = video_url.strip() if video_url else None
+
+    if existing_tools and (name_key or url_key or video_hash):
         for existing in existing_tools:
             reasons = []
 
             # Same tool name (case-insensitive)
-            if (
-                tool_name
-                and existing.get("tool_name")
-                and tool_name.strip().lower() == existing["tool_name"].strip().lower()
-            ):
+            existing_name = existing.get("tool_name")
+            if name_key and existing_name and name_key == existing_name.strip().lower():
                 reasons.append("same tool name")
 
             # Same video URL
-            if (
-                video_url
-                and existing.get("video_url")
-                and video_url.strip() == existing["video_url"].strip()
-            ):
+            existing_url = existing.get("video_url")
+            if url_key and existing_url and url_key == existing_url.strip():
                 reasons.append("same video URL")
 
             # Same video hash
-            if (
-                video_hash
-                and existing.get("video_hash")
-                and video_hash == existing["video_hash"]
-            ):
+            if video_hash and video_hash == existing.get("video_hash"):
                 reasons.append("identical video file")
 
             if reasons:
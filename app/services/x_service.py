@@ -13,23 +13,39 @@ Ref (media upload): https://developer.x.com/en/docs/media/upload-media/api-refer
 Ref (tweets):       https://developer.x.com/en/docs/twitter-api/tweets/manage-tweets
 """
 
+import math
+import mmap
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import requests
 from requests_oauthlib import OAuth1
 
 from app.config import settings
+from app.utils.http import build_session, response_json
 from app.utils.logger import get_logger
+from app.utils.streaming import MemoryviewReader, MultipartFileStream
 
 logger = get_logger(__name__)
 
+# Keep-alive session shared by every call in this module
+_SESSION = build_session()
+
 MEDIA_UPLOAD_URL = "https://upload.twitter.com/1.1/media/upload.json"
 TWEET_URL = "https://api.twitter.com/2/tweets"
 
 CHUNK_SIZE = 4 * 1024 * 1024  # 4 MB
 
+# Upper bound on concurrent APPENDs — keeps small instances from
+# saturating their uplink on long videos.
+_MAX_PARALLEL_APPENDS = 4
+
+# Per-segment retries on connection errors / timeouts / 5xx (1 s, then 2 s)
+_APPEND_RETRIES = 2
+_APPEND_BACKOFF_SECONDS = 1.0
+
 
 def _oauth() -> OAuth1:
     """Build an OAuth1 signer for every request."""
@@ -45,7 +61,7 @@ def _oauth() -> OAuth1:
 
 def _init_upload(file_size: int) -> str:
     """INIT command — returns a media_id string."""
-    resp = requests.post(
+    resp = _SESSION.post(
         MEDIA_UPLOAD_URL,
         data={
             "command": "INIT",
@@ -59,38 +75,79 @@ def _init_upload(file_size: int) -> str:
     if not resp.ok:
         logger.error("X INIT failed: %d %s", resp.status_code, resp.text[:500])
     resp.raise_for_status()
-    media_id: str = str(resp.json()["media_id"])
+    media_id: str = str(response_json(resp)["media_id"])
     logger.info("X: INIT complete — media_id=%s", media_id)
     return media_id
 
 
-def _append_chunks(media_id: str, video_path: str) -> None:
-    """APPEND command — upload file in ≤ 4 MB chunks."""
-    segment = 0
-    with open(video_path, "rb") as fh:
-        while True:
-            chunk = fh.read(CHUNK_SIZE)
-            if not chunk:
-                break
-            resp = requests.post(
-                MEDIA_UPLOAD_URL,
-                data={
+def _append_segment(media_id: str, view: memoryview, segment: int) -> None:
+    """APPEND one ≤ 4 MB segment, retrying transient failures.
+
+    urllib3 never repeats a POST, and the scheduler's retry would restart
+    the whole upload (new INIT, every segment again).  Re-sending the same
+    ``segment_index`` just overwrites that segment, so it is retried here.
+    """
+    start = segment * CHUNK_SIZE
+    with view[start : start + CHUNK_SIZE] as chunk:
+        for attempt in range(_APPEND_RETRIES + 1):
+            # Streamed straight from the mapping — no bytes copy of the
+            # segment, unlike files= which builds the whole body in memory
+            body = MultipartFileStream(
+                {
                     "command": "APPEND",
                     "media_id": media_id,
-                    "segment_index": segment,
+                    "segment_index": str(segment),
                 },
-                files={"media_data": chunk},
-                auth=_oauth(),
-                timeout=120,
+                "media_data",
+                "media_data",
+                "application/octet-stream",
+                MemoryviewReader(chunk),
+                len(chunk),
             )
-            resp.raise_for_status()
-            segment += 1
-    logger.info("X: APPEND complete — %d segment(s) uploaded.", segment)
+            try:
+                resp = _SESSION.post(
+                    MEDIA_UPLOAD_URL,
+                    data=body,
+                    headers=body.headers,
+                    auth=_oauth(),
+                    timeout=120,
+                )
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt == _APPEND_RETRIES:
+                    raise
+                logger.warning("X: APPEND segment %d failed (%s) — retrying", segment, exc)
+            else:
+                if resp.status_code < 500 or attempt == _APPEND_RETRIES:
+                    resp.raise_for_status()
+                    return
+                logger.warning(
+                    "X: APPEND segment %d got %d — retrying", segment, resp.status_code,
+                )
+            time.sleep(_APPEND_BACKOFF_SECONDS * 2 ** attempt)
+
+
+def _append_chunks(media_id: str, video_path: str, file_size: int) -> None:
+    """APPEND command — upload file in ≤ 4 MB chunks.
+
+    Segments are zero-copy ``memoryview`` slices of the mapped file and are
+    sent in parallel; X reassembles them by ``segment_index``.
+    """
+    if not file_size:
+        return  # nothing to send (and an empty file can't be mapped)
+    with open(video_path, "rb") as fh, mmap.mmap(
+        fh.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm, memoryview(mm) as view:
+        total = math.ceil(len(view) / CHUNK_SIZE)
+        workers = max(1, min(_MAX_PARALLEL_APPENDS, total))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="x-append") as pool:
+            # list() re-raises the first failed segment
+            list(pool.map(lambda seg: _append_segment(media_id, view, seg), range(total)))
+    logger.info("X: APPEND complete — %d segment(s) uploaded.", total)
 
 
 def _finalize(media_id: str) -> Optional[dict]:
     """FINALIZE command — returns processing_info if async processing needed."""
-    resp = requests.post(
+    resp = _SESSION.post(
         MEDIA_UPLOAD_URL,
         data={
             "command": "FINALIZE",
@@ -102,40 +159,48 @@ def _finalize(media_id: str) -> Optional[dict]:
     if not resp.ok:
         logger.error("X FINALIZE failed: %d %s", resp.status_code, resp.text[:500])
     resp.raise_for_status()
-    return resp.json().get("processing_info")
+    return response_json(resp).get("processing_info")
 
 
 def _wait_for_processing(media_id: str, processing_info: dict, max_wait: int = 300) -> bool:
-    """Poll STATUS until the media is ready."""
-    deadline = time.time() + max_wait
+    """Poll STATUS (with exponential backoff) until the media is ready.
+
+    X's ``check_after_secs`` is an upper bound, not a floor: short clips are
+    usually done well before it, so polling starts at 1 s and backs off by
+    1.5x up to the hint from the latest STATUS response.
+    """
+    deadline = time.monotonic() + max_wait
     check_after = processing_info.get("check_after_secs", 5)
+    delay = min(1.0, check_after)
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.error("X: media processing timed out.")
+            return False
+        time.sleep(min(delay, remaining))
 
-    while time.time() < deadline:
-        time.sleep(check_after)
-        resp = requests.get(
+        resp = _SESSION.get(
             MEDIA_UPLOAD_URL,
             params={"command": "STATUS", "media_id": media_id},
             auth=_oauth(),
             timeout=15,
         )
-        if not resp.ok:
-            continue
-        info = resp.json().get("processing_info", {})
-        state = info.get("state")
-        if state == "succeeded":
-            return True
-        if state == "failed":
-            logger.error("X: media processing failed — %s", info.get("error"))
-            return False
-        check_after = info.get("check_after_secs", 5)
-
-    logger.error("X: media processing timed out.")
-    return False
+        if resp.ok:
+            info = response_json(resp).get("processing_info", {})
+            state = info.get("state")
+            if state == "succeeded":
+                return True
+            if state == "failed":
+                logger.error("X: media processing failed — %s", info.get("error"))
+                return False
+            check_after = info.get("check_after_secs", check_after)
+        delay = min(delay * 1.5, check_after)
 
 
 def _create_tweet(caption: str, media_id: str) -> None:
     """POST a tweet via the v2 API with the uploaded media attached."""
-    resp = requests.post(
+    resp = _SESSION.post(
         TWEET_URL,
         json={
             "text": caption,
@@ -149,7 +214,7 @@ def _create_tweet(caption: str, media_id: str) -> None:
             "X tweet creation failed: %d %s", resp.status_code, resp.text[:500]
         )
     resp.raise_for_status()
-    tweet_id = resp.json().get("data", {}).get("id", "unknown")
+    tweet_id = response_json(resp).get("data", {}).get("id", "unknown")
     logger.info("X: tweet published — id=%s", tweet_id)
 
 
@@ -170,7 +235,7 @@ def post_to_x(caption: str, video_path: str) -> bool:
 
         logger.info("X: starting chunked upload (%s bytes)...", f"{file_size:,}")
         media_id = _init_upload(file_size)
-        _append_chunks(media_id, video_path)
+        _append_chunks(media_id, video_path, file_size)
 
         processing_info = _finalize(media_id)
         if processing_info:
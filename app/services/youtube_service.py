@@ -16,6 +16,7 @@ import requests
 
 from app.config import settings
 from app.utils.logger import get_logger
+from app.utils.streaming import ChunkedFileReader
 
 logger = get_logger(__name__)
 
@@ -107,7 +108,7 @@ def _upload_video(upload_uri: str, video_path: str, access_token: str) -> None:
     with open(video_path, "rb") as fh:
         resp = requests.put(
             upload_uri,
-            data=fh,
+            data=ChunkedFileReader(fh, file_size),  # 1 MB blocks, constant memory
             headers={
                 "Authorization": f"Bearer {access_token}",
                 "Content-Type": "video/mp4",
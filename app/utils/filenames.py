@@ -0,0 +1,17 @@
+"""
+Filename helpers.
+
+Usage:
+    from app.utils.filenames import safe_filename
+    dest = VIDEO_DIR / f"{safe_filename(tool_name)}.mp4"
+"""
+
+import re
+
+# Anything other than letters, digits, "-" and "_" becomes "_" in filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w-]")
+
+
+def safe_filename(name: str) -> str:
+    """Return *name* with every character unsafe in a filename replaced by ``_``."""
+    return _UNSAFE_FILENAME_CHARS.sub("_", name)
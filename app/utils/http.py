@@ -0,0 +1,126 @@
+"""
+Shared HTTP session factory.
+
+Usage:
+    from app.utils.http import build_session, post_json, response_json
+    _SESSION = build_session()
+    resp = _SESSION.get(url, timeout=15)
+    data = response_json(resp)
+"""
+
+import socket
+from typing import Any
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.config import settings
+
+# Transient statuses worth retrying (rate limiting + gateway hiccups)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+# Passing socket_options replaces urllib3's default (TCP_NODELAY only), so
+# keep it and add keepalive probes so idle long-poll connections aren't
+# silently dropped by NAT / load balancers.
+_KEEPALIVE_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_KEEPIDLE"):  # Linux
+    _KEEPALIVE_SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3),
+    ]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """``HTTPAdapter`` whose connections enable TCP keepalive probes."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = _KEEPALIVE_SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def build_session(
+    pool_connections: int = 4,
+    pool_maxsize: int | None = None,
+    retries: int = 3,
+    tcp_keepalive: bool = False,
+) -> requests.Session:
+    """Return a ``requests.Session`` with keep-alive pooling and retries.
+
+    Reusing one session per service lets successive API calls share TCP/TLS
+    connections instead of handshaking on every request.
+
+    Retries follow urllib3's defaults for which methods are safe to repeat,
+    so non-idempotent POSTs (publish, submit, ...) are never re-sent on an
+    error status.  ``raise_on_status`` is off: once retries are exhausted
+    the caller still receives the final response and handles it as before.
+
+    *pool_maxsize* defaults to ``settings.HTTP_POOL_MAXSIZE``.  Set
+    *tcp_keepalive* for sessions that hold connections idle for long
+    stretches (e.g. long polling).
+    """
+    session = requests.Session()
+    adapter_cls = _KeepAliveAdapter if tcp_keepalive else HTTPAdapter
+    adapter = adapter_cls(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize or settings.HTTP_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class BodyPreview:
+    """Lazy ``resp.text[:limit]`` for log arguments.
+
+    The body is only decoded if the log record is actually emitted.
+    """
+
+    __slots__ = ("_resp", "_limit")
+
+    def __init__(self, resp: requests.Response, limit: int = 500) -> None:
+        self._resp = resp
+        self._limit = limit
+
+    def __str__(self) -> str:
+        return self._resp.text[: self._limit]
+
+
+def response_json(resp: requests.Response) -> Any:
+    """Decode a JSON response body with orjson (faster than ``resp.json()``).
+
+    A body that isn't JSON raises ``requests.exceptions.JSONDecodeError``
+    (a ``RequestException``), exactly like ``resp.json()``, so callers'
+    ``except requests.RequestException`` still covers it.
+    """
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError as exc:
+        raise requests.exceptions.JSONDecodeError(exc.msg, exc.doc, exc.pos) from exc
+
+
+def post_json(
+    session: requests.Session,
+    url: str,
+    payload: Any,
+    headers: dict[str, str],
+    timeout: float,
+) -> requests.Response:
+    """POST *payload* serialised by orjson.
+
+    orjson emits ``bytes`` directly, so no intermediate ``str`` encode is
+    needed.  *headers* must already carry ``Content-Type: application/json``.
+    """
+    return session.post(url, data=orjson.dumps(payload), headers=headers, timeout=timeout)
@@ -7,14 +7,19 @@ Usage:
     logger.info("Processing tool", extra={"tool_id": 42})
 """
 
+import functools
 import logging
 import sys
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Return a pre-configured logger with structured JSON-like formatting.
 
+    Memoised per *name*: repeat calls skip the logging-manager lock and the
+    handler setup check.
+
     Args:
         name: Logger name, typically ``__name__`` of the calling module.
 
@@ -0,0 +1,58 @@
+"""
+Polling helper with exponential backoff + jitter.
+
+Usage:
+    from app.utils.poll import poll_until
+
+    def _check() -> bool | None:
+        status = fetch_status()
+        if status == "READY":
+            return True       # done — success
+        if status == "ERROR":
+            return False      # done — failure
+        return None           # keep polling
+
+    result = poll_until(_check, max_wait=300)
+    if result is None:
+        ...  # timed out
+"""
+
+import random
+import time
+from typing import Callable, Optional
+
+
+def poll_until(
+    check: Callable[[], Optional[bool]],
+    max_wait: float,
+    *,
+    first_delay: float = 0.5,
+    base_delay: float = 1.0,
+    max_delay: float = 15.0,
+    factor: float = 1.6,
+    jitter: float = 0.2,
+) -> Optional[bool]:
+    """Call *check* until it returns a bool or *max_wait* seconds elapse.
+
+    The first check runs after a short *first_delay* (many jobs are already
+    done by then); subsequent waits grow from *base_delay* by *factor* up to
+    *max_delay*, each randomised by ±*jitter* to avoid synchronised polling.
+
+    Returns:
+        The bool returned by *check*, or ``None`` on timeout.
+    """
+    deadline = time.monotonic() + max_wait
+    time.sleep(first_delay)
+    delay = base_delay
+
+    while True:
+        result = check()
+        if result is not None:
+            return result
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+
+        time.sleep(min(remaining, delay * (1 + random.uniform(-jitter, jitter))))
+        delay = min(delay * factor, max_delay)
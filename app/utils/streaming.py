@@ -0,0 +1,126 @@
+"""
+Streaming upload helpers.
+
+Usage:
+    from app.utils.streaming import ChunkedFileReader, MemoryviewReader, MultipartFileStream
+
+    with open(path, "rb") as fh:
+        requests.post(url, data=ChunkedFileReader(fh, file_size))
+
+    with open(path, "rb") as fh:
+        body = MultipartFileStream(fields, "file", name, "video/mp4", fh, file_size)
+        requests.post(url, data=body, headers=body.headers)
+
+    # One segment of an mmap'd file, streamed without copying it
+    part = MemoryviewReader(view[start:end])
+    body = MultipartFileStream(fields, "file", name, "video/mp4", part, len(part))
+"""
+
+import uuid
+from typing import BinaryIO
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+
+class ChunkedFileReader:
+    """Sized, read-only file wrapper for streaming request bodies.
+
+    ``requests`` sends file-like bodies with a ``Content-Length`` taken from
+    ``len()`` and urllib3 pulls them through ``read()`` in 16 KB blocks.
+    This wrapper reports the exact size and always serves *chunk_size*
+    blocks, so large videos stream in constant memory with far fewer
+    read/send round-trips.  (A generator body would instead force
+    ``Transfer-Encoding: chunked``.)
+    """
+
+    def __init__(self, fh: BinaryIO, size: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._fh = fh
+        self._size = size
+        self._chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def read(self, _size: int = -1) -> bytes:
+        return self._fh.read(self._chunk_size)
+
+
+class MemoryviewReader:
+    """Read-only file-like object over a ``memoryview``.
+
+    ``read()`` returns zero-copy slices, so a segment of a memory-mapped
+    file can be fed to :class:`MultipartFileStream` without first being
+    copied into a ``bytes`` object (``io.BytesIO`` would copy it).
+    """
+
+    def __init__(self, view: memoryview) -> None:
+        self._view = view
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def read(self, size: int = -1) -> memoryview:
+        end = len(self._view) if size < 0 else self._pos + size
+        chunk = self._view[self._pos : end]
+        self._pos += len(chunk)
+        return chunk
+
+
+class MultipartFileStream:
+    """Sized ``multipart/form-data`` body with one streamed file part.
+
+    ``requests``' ``files=`` builds the whole encoded body in memory, i.e.
+    reads the entire video up front.  This wrapper emits the form fields,
+    then the file in *chunk_size* blocks, then the closing boundary, so
+    memory stays constant and the upload starts immediately.  Send it with
+    ``data=body, headers=body.headers``.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, str],
+        file_field: str,
+        file_name: str,
+        content_type: str,
+        fh: BinaryIO,
+        size: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        boundary = uuid.uuid4().hex
+        head = b"".join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+            f"{value}\r\n".encode()
+            for name, value in fields.items()
+        )
+        head += (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; '
+            f'filename="{file_name}"\r\nContent-Type: {content_type}\r\n\r\n'
+        ).encode()
+        self._head = head
+        self._tail = f"\r\n--{boundary}--\r\n".encode()
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self._size = len(head) + size + len(self._tail)
+        self._stage = 0  # 0 = head, 1 = file, 2 = tail, 3 = done
+        self.headers = {
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(self._size),
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    def read(self, _size: int = -1) -> bytes:
+        if self._stage == 0:
+            self._stage = 1
+            return self._head
+        if self._stage == 1:
+            chunk = self._fh.read(self._chunk_size)
+            if chunk:
+                return chunk
+            self._stage = 2
+        if self._stage == 2:
+            self._stage = 3
+            return self._tail
+        return b""
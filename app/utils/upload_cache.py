@@ -0,0 +1,62 @@
+"""
+Cache of uploaded-but-not-yet-published media.
+
+When a post fails *after* its video was uploaded (publish error, processing
+timeout, ...), the next attempt for the same file can skip the upload and
+go straight to publishing with the remembered asset id.
+
+Usage:
+    from app.utils.upload_cache import file_key, get_upload, remember_upload
+
+    key = file_key(video_path)
+    video_id = get_upload("facebook", key) or _upload(...)
+    remember_upload("facebook", key, video_id)
+    ...publish...
+    forget_upload("facebook", key)
+"""
+
+import os
+import threading
+import time
+
+# Platforms discard unpublished uploads after a while; stay well inside that
+UPLOAD_CACHE_TTL_SECONDS = 3600
+
+_uploads: dict[tuple[str, str], tuple[str, float]] = {}
+_lock = threading.Lock()
+
+
+def file_key(path: str, st: os.stat_result | None = None) -> str:
+    """Return a cache key for the file at *path* as it is right now.
+
+    Keyed on (path, size, mtime) like the other file caches, so a first
+    attempt never has to read the whole video just to build the key.  Pass
+    *st* if the caller has already stat()ed the file.
+    """
+    st = st or os.stat(path)
+    return f"{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def get_upload(platform: str, key: str) -> str | None:
+    """Return the cached asset id for *key* on *platform*, if still fresh."""
+    with _lock:
+        entry = _uploads.get((platform, key))
+        if entry is None:
+            return None
+        asset_id, stored_at = entry
+        if time.monotonic() - stored_at > UPLOAD_CACHE_TTL_SECONDS:
+            del _uploads[(platform, key)]
+            return None
+        return asset_id
+
+
+def remember_upload(platform: str, key: str, asset_id: str) -> None:
+    """Record that *key* was uploaded to *platform* as *asset_id*."""
+    with _lock:
+        _uploads[(platform, key)] = (asset_id, time.monotonic())
+
+
+def forget_upload(platform: str, key: str) -> None:
+    """Drop the entry once the asset has been published (ids are single-use)."""
+    with _lock:
+        _uploads.pop((platform, key), None)
@@ -0,0 +1,39 @@
+"""
+Pre-render the fallback ambient tracks into music/ambient/.
+
+Run at build time (see render.yaml) so the first YouTube transform after a
+deploy doesn't have to synthesise one.  Always exits 0: a missing track
+just means the transform synthesises it on demand, as before.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def main() -> int:
+    try:
+        # Loading the transformer instantiates app.config.Settings, which
+        # needs env vars (DATABASE_URL, ...) that the build may not have
+        from app.services.video_transformer import (
+            AMBIENT_ASSET_DIR,
+            AMBIENT_ASSET_LENGTHS,
+            _ffmpeg_available,
+            _generate_ambient_track,
+        )
+
+        if not _ffmpeg_available():
+            print("ffmpeg not found — skipping ambient pre-render")
+            return 0
+
+        for length in AMBIENT_ASSET_LENGTHS:
+            path = _generate_ambient_track(length, out_dir=AMBIENT_ASSET_DIR)
+            print(f"ambient {length}s -> {path or 'FAILED'}")
+    except Exception as exc:
+        print(f"WARNING: ambient pre-render skipped: {exc!r}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())